@@ -17,292 +17,2405 @@ import shutil
 import psutil
 import threading
 import hashlib
+import hmac
 import secrets
-from pathlib import Path
+import asyncio
+import ctypes
+import errno
+import fnmatch
+import mmap
+import stat
+import struct
+import tempfile
+from pathlib import Path, PureWindowsPath
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
-import customtkinter as ctk
-from tkinter import messagebox, filedialog
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple, Callable, AsyncIterator
 import subprocess
 import platform
 import time
 import logging
+import logging.handlers
+import queue
+import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('chrome_data_destroyer.log'),
-        logging.StreamHandler()
-    ]
-)
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# The GUI is optional: the engine (WipeEngine and friends) and --incremental
+# must import on headless hosts without Tk or customtkinter
+try:
+    import customtkinter as ctk
+    from tkinter import messagebox, filedialog
+except ImportError:
+    ctk = None
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+DEFAULT_LOG_PATH = Path.home() / ".chromenuke" / "chrome_data_destroyer.log"
+
+class RepeatedErrorFilter(logging.Filter):
+    """
+    Rate-limits records that carry an 'aggregate_key' attribute (e.g. the
+    per-file wipe errors): at most `limit` per key per `window` seconds pass,
+    and the next one through reports how many were suppressed.
+    """
+    
+    def __init__(self, limit: int = 5, window: float = 10.0):
+        super().__init__()
+        self.limit = limit
+        self.window = window
+        self._lock = threading.Lock()
+        self._windows: Dict[str, List] = {}  # key -> [window start, passed, suppressed]
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = getattr(record, 'aggregate_key', None)
+        if key is None:
+            return True
+        
+        with self._lock:
+            now = time.monotonic()
+            state = self._windows.get(key)
+            if state is None or now - state[0] >= self.window:
+                suppressed = state[2] if state else 0
+                state = self._windows[key] = [now, 0, 0]
+                if suppressed:
+                    record.msg = f"{record.msg} ({suppressed} similar messages suppressed)"
+            
+            if state[1] >= self.limit:
+                state[2] += 1
+                return False
+            state[1] += 1
+            return True
+    
+    def pending(self) -> Dict[str, int]:
+        """Suppressed counts not yet reported, by key"""
+        with self._lock:
+            return {key: state[2] for key, state in self._windows.items() if state[2]}
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the most recent formatted log lines in memory for display"""
+    
+    def __init__(self, capacity: int = 2000):
+        super().__init__()
+        self._lines = deque(maxlen=capacity)
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            self._lines.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+    
+    def get_lines(self) -> List[str]:
+        return list(self._lines)
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that never blocks the caller: formatting is left to the
+    listener thread and records are dropped (and counted) when the queue is full
+    """
+    
+    dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+    
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            NonBlockingQueueHandler.dropped += 1
+
+class LogPipeline:
+    """Asynchronous logging setup, configured once by the entry point"""
+    
+    QUEUE_SIZE = 10000
+    
+    listener: Optional[logging.handlers.QueueListener] = None
+    ring_buffer: Optional[RingBufferHandler] = None
+    error_filter: Optional[RepeatedErrorFilter] = None
+    log_path: Optional[Path] = None
+    
+    @staticmethod
+    def start(log_path: Optional[Path] = None, level: int = logging.INFO, console: bool = True) -> Path:
+        """
+        Route the root logger through a bounded queue to a listener thread
+        that writes the log file, the console and the in-memory ring buffer
+        """
+        if LogPipeline.listener is not None:
+            LogPipeline.stop()
+        
+        log_path = Path(log_path) if log_path else DEFAULT_LOG_PATH
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        formatter = logging.Formatter(LOG_FORMAT)
+        handlers = [logging.FileHandler(log_path, encoding='utf-8')]
+        if console:
+            handlers.append(logging.StreamHandler())
+        LogPipeline.ring_buffer = RingBufferHandler()
+        handlers.append(LogPipeline.ring_buffer)
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue(maxsize=LogPipeline.QUEUE_SIZE)
+        queue_handler = NonBlockingQueueHandler(log_queue)
+        LogPipeline.error_filter = RepeatedErrorFilter()
+        queue_handler.addFilter(LogPipeline.error_filter)
+        
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(queue_handler)
+        root.setLevel(level)
+        
+        LogPipeline.listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        LogPipeline.listener.start()
+        LogPipeline.log_path = log_path
+        return log_path
+    
+    @staticmethod
+    def stop():
+        """Report pending suppressions, drain the queue and close the handlers"""
+        if LogPipeline.listener is None:
+            return
+        
+        for key, count in LogPipeline.error_filter.pending().items():
+            logging.warning(f"{count} similar messages suppressed ({key})")
+        if NonBlockingQueueHandler.dropped:
+            logging.warning(f"{NonBlockingQueueHandler.dropped} log records dropped (queue full)")
+        
+        LogPipeline.listener.stop()
+        for handler in LogPipeline.listener.handlers:
+            handler.close()
+        LogPipeline.listener = None
+    
+    @staticmethod
+    def recent_lines() -> List[str]:
+        """Most recent log lines, for display in the GUI"""
+        if LogPipeline.ring_buffer is None:
+            return []
+        return LogPipeline.ring_buffer.get_lines()
+
+class IOThrottle:
+    """
+    Token-bucket limiter for wipe I/O on bytes/sec and write operations/sec.
+    One instance is shared by every worker of a job; limits can be changed
+    while the wipe runs. None means unlimited.
+    """
+    
+    BURST_SECONDS = 0.25
+    
+    def __init__(self, bytes_per_sec: Optional[float] = None, iops: Optional[float] = None):
+        self._lock = threading.Lock()
+        self._bytes_per_sec = None
+        self._iops = None
+        self._byte_tokens = 0.0
+        self._op_tokens = 0.0
+        self._last_refill = time.monotonic()
+        self._apply_limits(bytes_per_sec, iops)
+    
+    def set_limits(self, bytes_per_sec: Optional[float] = None, iops: Optional[float] = None):
+        """Change the limits; takes effect on the next write"""
+        self._apply_limits(bytes_per_sec, iops)
+        logging.info(f"I/O limits set: {bytes_per_sec or 'unlimited'} bytes/s, {iops or 'unlimited'} IOPS")
+    
+    def _apply_limits(self, bytes_per_sec: Optional[float], iops: Optional[float]):
+        with self._lock:
+            self._bytes_per_sec = bytes_per_sec if bytes_per_sec and bytes_per_sec > 0 else None
+            self._iops = iops if iops and iops > 0 else None
+            if self._bytes_per_sec:
+                self._byte_tokens = min(self._byte_tokens, self._bytes_per_sec * self.BURST_SECONDS)
+            if self._iops:
+                self._op_tokens = min(self._op_tokens, self._iops * self.BURST_SECONDS)
+    
+    @property
+    def limits(self) -> Tuple[Optional[float], Optional[float]]:
+        return self._bytes_per_sec, self._iops
+    
+    def consume(self, nbytes: int, ops: int = 1):
+        """Block until nbytes and ops may be written under the current limits"""
+        if self._bytes_per_sec is None and self._iops is None:
+            return
+        
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._last_refill = now
+            wait = 0.0
+            
+            # Tokens may go negative: a large write is paid for by sleeping off the debt
+            if self._bytes_per_sec:
+                capacity = self._bytes_per_sec * self.BURST_SECONDS
+                self._byte_tokens = min(capacity, self._byte_tokens + elapsed * self._bytes_per_sec) - nbytes
+                if self._byte_tokens < 0:
+                    wait = -self._byte_tokens / self._bytes_per_sec
+            
+            if self._iops:
+                capacity = self._iops * self.BURST_SECONDS
+                self._op_tokens = min(capacity, self._op_tokens + elapsed * self._iops) - ops
+                if self._op_tokens < 0:
+                    wait = max(wait, -self._op_tokens / self._iops)
+        
+        if wait > 0:
+            time.sleep(wait)
+
+class IOPriority:
+    """Lower the I/O scheduling class and CPU niceness of the calling worker thread"""
+    
+    IOPRIO_CLASS_RT = 1
+    IOPRIO_CLASS_BE = 2
+    IOPRIO_CLASS_IDLE = 3
+    IOPRIO_CLASS_SHIFT = 13
+    IOPRIO_WHO_PROCESS = 1
+    
+    # ioprio_set syscall numbers by architecture
+    SYSCALL_NUMBERS = {
+        'x86_64': 251,
+        'amd64': 251,
+        'i386': 289,
+        'i686': 289,
+        'aarch64': 30,
+        'arm64': 30,
+        'armv7l': 314,
+        'ppc64le': 273,
+        's390x': 282,
+        'riscv64': 30
+    }
+    
+    @staticmethod
+    def set_io_priority(io_class: int = IOPRIO_CLASS_IDLE, level: int = 7) -> bool:
+        """
+        Set the I/O scheduling class (and level 0-7 for RT/BE) of the calling
+        thread via ioprio_set. Linux only; returns False where unsupported.
+        """
+        if platform.system() != "Linux":
+            logging.warning("I/O scheduling class is only supported on Linux")
+            return False
+        
+        syscall_nr = IOPriority.SYSCALL_NUMBERS.get(platform.machine().lower())
+        if syscall_nr is None:
+            logging.warning(f"ioprio_set not known for architecture {platform.machine()}")
+            return False
+        
+        value = (io_class << IOPriority.IOPRIO_CLASS_SHIFT) | (level & 0x7)
+        libc = ctypes.CDLL(None, use_errno=True)
+        # who=0 targets the calling thread
+        if libc.syscall(syscall_nr, IOPriority.IOPRIO_WHO_PROCESS, 0, value) != 0:
+            err = ctypes.get_errno()
+            logging.warning(f"ioprio_set failed: {os.strerror(err)}")
+            return False
+        
+        logging.info(f"I/O priority set to class {io_class}, level {level}")
+        return True
+    
+    @staticmethod
+    def set_niceness(level: int = 10) -> bool:
+        """
+        Set the CPU niceness of the calling worker to level, an absolute value,
+        so repeated calls do not stack. On Linux setpriority applies to the
+        calling thread only. A niceness already above level is kept.
+        """
+        if not hasattr(os, "nice"):
+            logging.warning("os.nice is not available on this platform")
+            return False
+        try:
+            if hasattr(os, "setpriority"):
+                current = os.getpriority(os.PRIO_PROCESS, 0)
+                if level > current:
+                    os.setpriority(os.PRIO_PROCESS, 0, level)
+            else:
+                current = os.nice(0)
+                if level > current:
+                    os.nice(level - current)
+            return True
+        except OSError as e:
+            logging.warning(f"Could not change niceness: {e}")
+            return False
+    
+    @staticmethod
+    def apply(settings: Optional[Dict]) -> None:
+        """Apply {'io_class', 'io_level', 'nice'} settings to the calling thread"""
+        if not settings:
+            return
+        if settings.get('io_class') is not None:
+            IOPriority.set_io_priority(settings['io_class'], settings.get('io_level', 7))
+        if settings.get('nice'):
+            IOPriority.set_niceness(settings['nice'])
+
+class DeviceTuner:
+    """
+    Chooses wipe concurrency, write size and file ordering for a device.
+    Linux block devices are described by /sys/dev/block/MAJ:MIN/queue:
+    rotational disks get a single stream of large writes in locality order,
+    SSD/NVMe get parallel workers scaled to the queue depth. Devices without
+    sysfs queue data (other platforms, tmpfs, network or btrfs anonymous
+    devices) keep the conservative defaults.
+    
+    Files of at least mmap_threshold bytes may be overwritten through
+    memory-mapped windows of mmap_window bytes instead of write() calls;
+    with 'mmap' left as None, prefer_mmap() benchmarks both on the device.
+    """
+    
+    SYSFS_BLOCK = Path("/sys/dev/block")
+    DEFAULTS = {
+        'workers': 1,
+        'chunk_size': 64 * 1024,
+        'sort_by_locality': False,
+        'mmap': None,
+        'mmap_threshold': 64 * 1024 * 1024,
+        'mmap_window': 64 * 1024 * 1024
+    }
+    ROTATIONAL_CHUNK = 1024 * 1024
+    SOLID_STATE_CHUNK = 256 * 1024
+    MIN_CHUNK = 4096
+    MAX_CHUNK = 4 * 1024 * 1024
+    MAX_WORKERS = 16
+    BENCHMARK_BYTES = 32 * 1024 * 1024
+    MMAP_MARGIN = 0.9
+    
+    _cache: Dict[int, Dict] = {}
+    _mmap_cache: Dict[int, bool] = {}
+    _cache_lock = threading.Lock()
+    
+    @staticmethod
+    def queue_dir(device: int) -> Optional[Path]:
+        """sysfs queue directory of the disk holding device, resolving partitions to their disk"""
+        node = DeviceTuner.SYSFS_BLOCK / f"{os.major(device)}:{os.minor(device)}"
+        try:
+            node = node.resolve(strict=True)
+        except (OSError, RuntimeError):
+            return None
+        if (node / "partition").exists():
+            node = node.parent
+        queue_dir = node / "queue"
+        return queue_dir if queue_dir.is_dir() else None
+    
+    @staticmethod
+    def read_queue(device: int) -> Dict:
+        """rotational, optimal_io_size and nr_requests of a device; None where unknown"""
+        info = {'rotational': None, 'optimal_io_size': None, 'nr_requests': None}
+        queue_dir = DeviceTuner.queue_dir(device) if hasattr(os, "major") else None
+        if queue_dir is None:
+            return info
+        for key in info:
+            try:
+                info[key] = int((queue_dir / key).read_text().strip())
+            except (OSError, ValueError):
+                pass
+        if info['rotational'] is not None:
+            info['rotational'] = bool(info['rotational'])
+        return info
+    
+    @staticmethod
+    def is_solid_state(device: Optional[int]) -> bool:
+        """True only when sysfs reports the device as non-rotational"""
+        return device is not None and hasattr(os, "major") and DeviceTuner.read_queue(device)['rotational'] is False
+    
+    @staticmethod
+    def tune(device: Optional[int], overrides: Optional[Dict] = None) -> Dict:
+        """
+        Tuning for a device (st_dev) as {'workers', 'chunk_size',
+        'sort_by_locality'}. Automatic choices are cached and logged once
+        per device; non-None values in overrides replace them.
+        """
+        tuning = dict(DeviceTuner.DEFAULTS)
+        if device is not None:
+            with DeviceTuner._cache_lock:
+                cached = DeviceTuner._cache.get(device)
+            if cached is None:
+                cached = DeviceTuner._auto_tune(device)
+                with DeviceTuner._cache_lock:
+                    DeviceTuner._cache[device] = cached
+            tuning.update(cached)
+        
+        for key, value in (overrides or {}).items():
+            if key in tuning and value is not None:
+                tuning[key] = value
+        return tuning
+    
+    @staticmethod
+    def prefer_mmap(device: Optional[int], directory: Path, tuning: Dict) -> bool:
+        """
+        Benchmark one pass of the write() and mmap overwrite engines on a
+        temp file next to the target and report whether mmap was clearly
+        faster (by MMAP_MARGIN). Cached per device; False if the benchmark
+        cannot run.
+        """
+        with DeviceTuner._cache_lock:
+            if device in DeviceTuner._mmap_cache:
+                return DeviceTuner._mmap_cache[device]
+        
+        directory = Path(directory)
+        while not directory.is_dir() and directory != directory.parent:
+            directory = directory.parent
+        
+        size = DeviceTuner.BENCHMARK_BYTES
+        window = min(tuning['mmap_window'], size)
+        timings = {}
+        try:
+            fd, temp_path = tempfile.mkstemp(prefix=".chromenuke-bench-", dir=str(directory))
+            try:
+                with os.fdopen(fd, "r+b") as file:
+                    # Untimed first pass allocates the blocks, so both engines overwrite in place
+                    file.truncate(size)
+                    SecureDeletion._overwrite(file, size, 1, "zero", None, None, temp_path, tuning['chunk_size'])
+                    for engine, mmap_window in (("write", None), ("mmap", window)):
+                        start = time.perf_counter()
+                        SecureDeletion._overwrite(file, size, 1, "zero", None, None, temp_path,
+                                                  tuning['chunk_size'], mmap_window)
+                        timings[engine] = time.perf_counter() - start
+            finally:
+                os.remove(temp_path)
+        except (OSError, ValueError) as e:
+            logging.warning(f"mmap benchmark in {directory} failed, using write(): {e}")
+            return False
+        
+        use_mmap = timings['mmap'] < timings['write'] * DeviceTuner.MMAP_MARGIN
+        logging.info(
+            f"Overwrite benchmark on {directory}: write() {size / timings['write'] / (1024 * 1024):.0f} MB/s, "
+            f"mmap {size / timings['mmap'] / (1024 * 1024):.0f} MB/s; "
+            f"using {'mmap' if use_mmap else 'write()'} for files over {tuning['mmap_threshold'] // (1024 * 1024)} MB"
+        )
+        with DeviceTuner._cache_lock:
+            DeviceTuner._mmap_cache[device] = use_mmap
+        return use_mmap
+    
+    @staticmethod
+    def _auto_tune(device: int) -> Dict:
+        info = DeviceTuner.read_queue(device)
+        tuning = {key: DeviceTuner.DEFAULTS[key] for key in ('workers', 'chunk_size', 'sort_by_locality')}
+        optimal = info['optimal_io_size'] or 0
+        
+        if info['rotational'] is True:
+            # One sequential stream; seeking between files dominates on spinning disks
+            tuning['workers'] = 1
+            tuning['chunk_size'] = max(DeviceTuner.ROTATIONAL_CHUNK, optimal)
+            tuning['sort_by_locality'] = True
+            kind = "rotational"
+        elif info['rotational'] is False:
+            depth = info['nr_requests'] or 32
+            tuning['workers'] = max(2, min(os.cpu_count() or 2, depth // 16, DeviceTuner.MAX_WORKERS))
+            tuning['chunk_size'] = max(DeviceTuner.SOLID_STATE_CHUNK, optimal)
+            kind = "non-rotational"
+        else:
+            kind = "unknown"
+        
+        # Whole multiples of optimal_io_size; a device whose optimal size exceeds
+        # MAX_CHUNK (RAID stripes, 33553920 on some controllers) gets one unit per write
+        chunk_size = min(tuning['chunk_size'], DeviceTuner.MAX_CHUNK)
+        if optimal:
+            chunk_size = chunk_size - chunk_size % optimal if optimal <= chunk_size else optimal
+        tuning['chunk_size'] = max(chunk_size, DeviceTuner.MIN_CHUNK)
+        
+        logging.info(
+            f"Device {os.major(device)}:{os.minor(device)} ({kind}, optimal_io_size={info['optimal_io_size']}, "
+            f"nr_requests={info['nr_requests']}): {tuning['workers']} worker(s), "
+            f"{tuning['chunk_size'] // 1024} KB writes, locality sort {'on' if tuning['sort_by_locality'] else 'off'}"
+        )
+        return tuning
+
+class WipeCancelled(Exception):
+    """Raised inside the wipe engine when a cancellation has been requested"""
 
 class SecureDeletion:
     """Military-grade secure deletion implementation"""
     
+    DEFAULT_SCHEME = "dod5220"
+    SCHEMES = ("dod5220", "zero", "random")
+    
+    # fwalk and dir_fd-relative open/stat/unlink/rmdir (POSIX); path-based fallback elsewhere
+    DIR_FD_SUPPORTED = hasattr(os, "fwalk") and all(
+        func in os.supports_dir_fd for func in (os.open, os.stat, os.unlink, os.rmdir)
+    )
+    MAX_OPEN_DIRS = 64
+    
+    @staticmethod
+    def pass_pattern(pass_num: int, size: int, scheme: str = DEFAULT_SCHEME) -> bytes:
+        """
+        Overwrite buffer for a pass. The dod5220 scheme writes zeros, ones,
+        then random data, repeating; 'zero' and 'random' use one pattern
+        for every pass.
+        """
+        if scheme == "zero":
+            return b'\x00' * size
+        if scheme == "random":
+            return secrets.token_bytes(size)
+        
+        if pass_num % 3 == 0:
+            # Pass 1: Write zeros
+            return b'\x00' * size
+        elif pass_num % 3 == 1:
+            # Pass 2: Write ones
+            return b'\xFF' * size
+        else:
+            # Pass 3: Write random data
+            return secrets.token_bytes(size)
+    
+    @staticmethod
+    def _overwrite(file, file_size: int, passes: int, scheme: str,
+                   cancel_event: Optional[threading.Event], throttle: Optional[IOThrottle],
+                   label: str, chunk_size: int = DeviceTuner.DEFAULTS['chunk_size'],
+                   mmap_window: Optional[int] = None) -> None:
+        """
+        Run the overwrite passes over an open file object, writing chunk_size
+        bytes at a time, or through mmap windows when mmap_window is set
+        """
+        if chunk_size < 1:
+            raise ValueError(f"Invalid chunk size: {chunk_size}")
+        if mmap_window:
+            file.flush()
+            SecureDeletion._mmap_overwrite(file.fileno(), file_size, passes, scheme, cancel_event,
+                                           throttle, label, chunk_size, mmap_window)
+            return
+        
+        file.flush()
+        fd = file.fileno()
+        for pass_num in range(passes):
+            os.lseek(fd, 0, os.SEEK_SET)
+            pattern = SecureDeletion.pass_pattern(pass_num, min(chunk_size, file_size), scheme)
+            SecureDeletion.write_chunks(fd, pattern, file_size, cancel_event, throttle, label)
+            os.fsync(fd)
+    
+    @staticmethod
+    def write_chunks(fd: int, pattern: bytes, total: int,
+                     cancel_event: Optional[threading.Event], throttle: Optional[IOThrottle],
+                     label: str, on_chunk: Optional[Callable[[int], None]] = None) -> int:
+        """
+        Write total bytes at fd's current offset by repeating pattern, one
+        chunk per write call. This is the write path shared by the overwrite
+        passes and the free-space fill: cancel_event is checked and throttle
+        paced before every chunk, and on_chunk(count) follows each write.
+        OSErrors (e.g. ENOSPC) propagate after the bytes already written
+        have been reported.
+        """
+        view = memoryview(pattern)
+        written = 0
+        while written < total:
+            if cancel_event is not None and cancel_event.is_set():
+                raise WipeCancelled(label)
+            count = min(len(view), total - written)
+            if throttle is not None:
+                throttle.consume(count)
+            count = os.write(fd, view[:count])
+            written += count
+            if on_chunk is not None:
+                on_chunk(count)
+        return written
+    
+    @staticmethod
+    def _mmap_overwrite(fd: int, file_size: int, passes: int, scheme: str,
+                        cancel_event: Optional[threading.Event], throttle: Optional[IOThrottle],
+                        label: str, chunk_size: int, window: int) -> None:
+        """
+        Overwrite passes through memory-mapped windows of the file. Each
+        window is filled from the pass pattern, flushed (msync) and unmapped
+        before the next, so no more than window bytes are mapped at once.
+        Only used while no browser is running (see wipe_plan_entry).
+        """
+        if chunk_size < 1:
+            raise ValueError(f"Invalid chunk size: {chunk_size}")
+        granularity = mmap.ALLOCATIONGRANULARITY
+        window = max(granularity, window - window % granularity)
+        
+        for pass_num in range(passes):
+            pattern = SecureDeletion.pass_pattern(pass_num, min(chunk_size, file_size), scheme)
+            
+            for offset in range(0, file_size, window):
+                length = min(window, file_size - offset)
+                # Touching a mapped page past EOF raises SIGBUS, so fail the file instead
+                if os.fstat(fd).st_size < offset + length:
+                    raise OSError(errno.EBUSY, "file was truncated during wipe")
+                with mmap.mmap(fd, length, access=mmap.ACCESS_WRITE, offset=offset) as view:
+                    position = 0
+                    while position < length:
+                        if cancel_event is not None and cancel_event.is_set():
+                            raise WipeCancelled(label)
+                        chunk = min(len(pattern), length - position)
+                        if throttle is not None:
+                            throttle.consume(chunk)
+                        view[position:position + chunk] = pattern[:chunk]
+                        position += chunk
+                    view.flush()
+            
+            os.fsync(fd)
+    
+    @staticmethod
+    def _open_dir(path: str, expected: Optional[Tuple[int, int]] = None) -> Optional[int]:
+        """
+        Open a directory for dir_fd-relative operations; None if it no longer
+        exists. The last component is not followed if it is a symlink, and
+        when expected (st_dev, st_ino) is given the opened directory must be
+        that one, so a directory swapped since planning is refused.
+        """
+        flags = os.O_RDONLY | os.O_NOFOLLOW | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_CLOEXEC", 0)
+        try:
+            dir_fd = os.open(path, flags)
+        except FileNotFoundError:
+            return None
+        if expected is not None:
+            opened = os.fstat(dir_fd)
+            if (opened.st_dev, opened.st_ino) != tuple(expected):
+                os.close(dir_fd)
+                raise OSError(errno.EEXIST, "directory was replaced since planning; not wiped")
+        return dir_fd
+    
+    @staticmethod
+    def _wipe_at(name: str, dir_fd: int, passes: int = 7,
+                 cancel_event: Optional[threading.Event] = None,
+                 throttle: Optional[IOThrottle] = None,
+                 scheme: str = DEFAULT_SCHEME, label: Optional[str] = None,
+                 chunk_size: int = DeviceTuner.DEFAULTS['chunk_size'],
+                 mmap_window: Optional[int] = None,
+                 expected: Optional[Tuple[int, int]] = None) -> bool:
+        """
+        Wipe and unlink the entry `name` of an open directory. The file is
+        opened once without following symlinks, sized with fstat, and only
+        unlinked if the name still refers to the inode that was overwritten.
+        Symlinks, FIFOs, sockets and device nodes are unlinked without being
+        opened: they hold no data, and opening a socket fails with ENXIO.
+        When expected (st_dev, st_ino) is given, an entry that is no longer
+        the planned one is neither overwritten nor unlinked.
+        """
+        label = label or name
+        try:
+            try:
+                st = os.stat(name, dir_fd=dir_fd, follow_symlinks=False)
+            except FileNotFoundError:
+                return True
+            if expected is not None and (st.st_dev, st.st_ino) != tuple(expected):
+                raise OSError(errno.EEXIST, "file was replaced since planning; not wiped")
+            if not stat.S_ISREG(st.st_mode):
+                os.unlink(name, dir_fd=dir_fd)
+                return True
+            
+            flags = os.O_RDWR | os.O_NOFOLLOW | os.O_NONBLOCK | getattr(os, "O_CLOEXEC", 0)
+            try:
+                fd = os.open(name, flags, dir_fd=dir_fd)
+            except FileNotFoundError:
+                return True
+            
+            with os.fdopen(fd, "r+b") as file:
+                opened = os.fstat(fd)
+                if (opened.st_dev, opened.st_ino) != (st.st_dev, st.st_ino):
+                    raise OSError(errno.EEXIST, "file was replaced during wipe; not removed")
+                st = opened
+                if st.st_size > 0:
+                    SecureDeletion._overwrite(file, st.st_size, passes, scheme, cancel_event,
+                                              throttle, label, chunk_size, mmap_window)
+            
+            # Remove the file after wiping, unless it was swapped out meanwhile
+            current = os.stat(name, dir_fd=dir_fd, follow_symlinks=False)
+            if (current.st_dev, current.st_ino) != (st.st_dev, st.st_ino):
+                raise OSError(errno.EEXIST, "file was replaced during wipe; not removed")
+            os.unlink(name, dir_fd=dir_fd)
+            return True
+            
+        except WipeCancelled:
+            raise
+        except Exception as e:
+            logging.error("Error wiping file %s: %s", label, e,
+                          extra={'aggregate_key': f"wipe:{type(e).__name__}"})
+            return False
+    
     @staticmethod
-    def dod_5220_22_m_wipe(filepath: str, passes: int = 7) -> bool:
+    def dod_5220_22_m_wipe(filepath: str, passes: int = 7,
+                           cancel_event: Optional[threading.Event] = None,
+                           throttle: Optional[IOThrottle] = None,
+                           scheme: str = DEFAULT_SCHEME,
+                           chunk_size: int = DeviceTuner.DEFAULTS['chunk_size'],
+                           mmap_window: Optional[int] = None,
+                           expected: Optional[Tuple[int, int]] = None) -> bool:
         """
         DoD 5220.22-M standard wiping with multiple passes
         Pass 1: Write 0x00
         Pass 2: Write 0xFF  
         Pass 3: Write random data
         Repeat pattern for specified passes
+        
+        cancel_event is checked before every chunk; when set, WipeCancelled
+        is raised and the file is left in place, partially overwritten.
+        throttle, if given, paces every chunk write. scheme selects the
+        pass patterns (see pass_pattern); chunk_size is the write size and
+        mmap_window, if set, switches to the mmap engine (see DeviceTuner).
+        expected, the planned (st_dev, st_ino), refuses a replaced file.
         """
+        if SecureDeletion.DIR_FD_SUPPORTED:
+            parent, name = os.path.split(os.path.abspath(filepath))
+            try:
+                dir_fd = SecureDeletion._open_dir(parent)
+            except OSError as e:
+                logging.error("Error wiping file %s: %s", filepath, e,
+                              extra={'aggregate_key': f"wipe:{type(e).__name__}"})
+                return False
+            if dir_fd is None:
+                return True
+            try:
+                return SecureDeletion._wipe_at(name, dir_fd, passes, cancel_event, throttle, scheme,
+                                               filepath, chunk_size, mmap_window, expected)
+            finally:
+                os.close(dir_fd)
+        
         try:
-            if not os.path.exists(filepath):
+            try:
+                st = os.lstat(filepath)
+            except FileNotFoundError:
                 return True
-                
-            file_size = os.path.getsize(filepath)
-            if file_size == 0:
+            if expected is not None and (st.st_dev, st.st_ino) != tuple(expected):
+                raise OSError(errno.EEXIST, "file was replaced since planning; not wiped")
+            
+            # Empty files, symlinks and special files have nothing to overwrite
+            file_size = st.st_size
+            if file_size == 0 or not stat.S_ISREG(st.st_mode):
                 os.remove(filepath)
                 return True
             
             with open(filepath, "r+b") as file:
-                for pass_num in range(passes):
-                    file.seek(0)
-                    
-                    if pass_num % 3 == 0:
-                        # Pass 1: Write zeros
-                        pattern = b'\x00' * min(8192, file_size)
-                    elif pass_num % 3 == 1:
-                        # Pass 2: Write ones
-                        pattern = b'\xFF' * min(8192, file_size)
-                    else:
-                        # Pass 3: Write random data
-                        pattern = secrets.token_bytes(min(8192, file_size))
-                    
-                    bytes_written = 0
-                    while bytes_written < file_size:
-                        chunk_size = min(len(pattern), file_size - bytes_written)
-                        file.write(pattern[:chunk_size])
-                        bytes_written += chunk_size
-                    
-                    file.flush()
-                    os.fsync(file.fileno())
+                SecureDeletion._overwrite(file, file_size, passes, scheme, cancel_event,
+                                          throttle, filepath, chunk_size, mmap_window)
             
             # Remove the file after wiping
             os.remove(filepath)
             return True
             
+        except WipeCancelled:
+            raise
         except Exception as e:
-            logging.error(f"Error wiping file {filepath}: {e}")
+            logging.error("Error wiping file %s: %s", filepath, e,
+                          extra={'aggregate_key': f"wipe:{type(e).__name__}"})
             return False
     
     @staticmethod
-    def secure_directory_wipe(directory: str, passes: int = 7) -> bool:
-        """Securely wipe entire directory structure"""
+    def _rmdir_at(name: str, dir_fd: int) -> None:
+        """Remove an empty subdirectory (or a symlink listed as one) of an open directory"""
         try:
-            if not os.path.exists(directory):
-                return True
-                
+            os.rmdir(name, dir_fd=dir_fd)
+        except NotADirectoryError:
+            os.unlink(name, dir_fd=dir_fd)
+        except OSError:
+            pass
+    
+    @staticmethod
+    def _remove_empty_dirs(directory: str) -> None:
+        """Remove a directory tree bottom-up, leaving any non-empty directories"""
+        if SecureDeletion.DIR_FD_SUPPORTED:
+            for root, dirs, files, root_fd in os.fwalk(directory, topdown=False):
+                for dir_name in dirs:
+                    SecureDeletion._rmdir_at(dir_name, root_fd)
+        else:
             for root, dirs, files in os.walk(directory, topdown=False):
-                # Wipe all files
-                for file in files:
-                    filepath = os.path.join(root, file)
-                    SecureDeletion.dod_5220_22_m_wipe(filepath, passes)
-                
-                # Remove directories
                 for dir_name in dirs:
-                    dir_path = os.path.join(root, dir_name)
                     try:
-                        os.rmdir(dir_path)
+                        os.rmdir(os.path.join(root, dir_name))
                     except OSError:
                         pass
-            
-            # Remove root directory
-            try:
-                os.rmdir(directory)
-            except OSError:
-                pass
+        try:
+            os.rmdir(directory)
+        except OSError:
+            pass
+    
+    @staticmethod
+    def wipe_plan_entry(entry: Dict, cancel_event: Optional[threading.Event] = None,
+                        on_file: Optional[Callable[[Dict, bool, float], None]] = None,
+                        throttle: Optional[IOThrottle] = None,
+                        tuning: Optional[Dict] = None) -> Dict[str, int]:
+        """
+        Wipe exactly the files of one planned target (see WipePlanner),
+        each with its planned pass count, then remove emptied directories.
+        on_file(file, ok, seconds) is called after each file, from worker
+        threads when tuning asks for more than one worker. A cancellation
+        stops at the next chunk and skips directory cleanup.
+        
+        tuning is a DeviceTuner.tune() result (defaults when None); when its
+        'mmap' is None and large files are planned, the faster overwrite
+        engine is benchmarked first. Worker threads are started from the
+        calling thread and inherit its I/O priority and niceness.
+        """
+        tuning = {**DeviceTuner.DEFAULTS, **(tuning or {})}
+        files = entry['files']
+        large_files = any(f['size'] >= tuning['mmap_threshold'] for f in files)
+        if large_files and tuning['mmap'] is not False and ProcessManager.is_chrome_running():
+            # A running browser may truncate a mapped database, which kills us with SIGBUS
+            logging.warning(f"Browser is running; overwriting large files in {entry['path']} with write()")
+            tuning['mmap'] = False
+        if tuning['mmap'] is None:
+            tuning['mmap'] = large_files and DeviceTuner.prefer_mmap(entry['device'], entry['path'], tuning)
+        if tuning['sort_by_locality']:
+            # Inode order approximates on-disk order on ext4/XFS allocation groups
+            files = sorted(files, key=lambda f: f['inode'])
+        
+        workers = max(1, min(tuning['workers'], len(files)))
+        
+        def run_batch(batch):
+            return SecureDeletion._wipe_files(batch, cancel_event, on_file, throttle, tuning)
+        
+        if workers == 1:
+            result = run_batch(files)
+        else:
+            # Several small batches per worker keep the workers evenly loaded
+            size = -(-len(files) // (workers * 4))
+            batches = [files[i:i + size] for i in range(0, len(files), size)]
+            result = {'files_wiped': 0, 'bytes_wiped': 0, 'failed': 0, 'cancelled': False}
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wipe") as pool:
+                for batch_result in pool.map(run_batch, batches):
+                    for key in ('files_wiped', 'bytes_wiped', 'failed'):
+                        result[key] += batch_result[key]
+                    result['cancelled'] = result['cancelled'] or batch_result['cancelled']
+        
+        if result['cancelled']:
+            return result
+        
+        for root in entry['roots']:
+            if os.path.isdir(root):
+                SecureDeletion._remove_empty_dirs(root)
+        
+        return result
+    
+    @staticmethod
+    def _wipe_files(files: List[Dict], cancel_event: Optional[threading.Event],
+                    on_file: Optional[Callable[[Dict, bool, float], None]],
+                    throttle: Optional[IOThrottle], tuning: Dict) -> Dict[str, int]:
+        """
+        Wipe a list of planned files in order. Parent directories are opened
+        once and files are wiped relative to those descriptors; at most
+        MAX_OPEN_DIRS directories are held open at a time. Directories and
+        files must still be the inodes recorded in the plan.
+        """
+        chunk_size = tuning['chunk_size']
+        result = {'files_wiped': 0, 'bytes_wiped': 0, 'failed': 0, 'cancelled': False}
+        dir_fds: Dict[str, Optional[int]] = {}
+        
+        try:
+            for file in files:
+                if cancel_event is not None and cancel_event.is_set():
+                    result['cancelled'] = True
+                    return result
                 
-            return True
-            
-        except Exception as e:
-            logging.error(f"Error wiping directory {directory}: {e}")
-            return False
+                start = time.perf_counter()
+                scheme = file.get('scheme', SecureDeletion.DEFAULT_SCHEME)
+                mmap_window = None
+                if tuning['mmap'] and file['size'] >= tuning['mmap_threshold']:
+                    mmap_window = tuning['mmap_window']
+                expected = (file['device'], file['inode'])
+                try:
+                    if SecureDeletion.DIR_FD_SUPPORTED:
+                        parent, name = os.path.split(file['path'])
+                        if parent not in dir_fds:
+                            if len(dir_fds) >= SecureDeletion.MAX_OPEN_DIRS:
+                                SecureDeletion._close_dirs(dir_fds)
+                            dir_fds[parent] = SecureDeletion._open_dir(parent, file['dir'])
+                        dir_fd = dir_fds[parent]
+                        # A vanished directory means its files are already gone
+                        ok = dir_fd is None or SecureDeletion._wipe_at(
+                            name, dir_fd, file['passes'], cancel_event, throttle, scheme,
+                            file['path'], chunk_size, mmap_window, expected
+                        )
+                    else:
+                        ok = SecureDeletion.dod_5220_22_m_wipe(
+                            file['path'], file['passes'], cancel_event, throttle, scheme,
+                            chunk_size, mmap_window, expected
+                        )
+                except WipeCancelled:
+                    result['cancelled'] = True
+                    return result
+                except OSError as e:
+                    logging.error("Error wiping file %s: %s", file['path'], e,
+                                  extra={'aggregate_key': f"wipe:{type(e).__name__}"})
+                    ok = False
+                
+                if ok:
+                    result['files_wiped'] += 1
+                    result['bytes_wiped'] += file['size']
+                else:
+                    result['failed'] += 1
+                
+                if on_file is not None:
+                    on_file(file, ok, time.perf_counter() - start)
+        finally:
+            SecureDeletion._close_dirs(dir_fds)
+        
+        return result
+    
+    @staticmethod
+    def _close_dirs(dir_fds: Dict[str, Optional[int]]) -> None:
+        for dir_fd in dir_fds.values():
+            if dir_fd is not None:
+                os.close(dir_fd)
+        dir_fds.clear()
+
+# Chromium-family browsers: user data directory and cache root per platform,
+# plus the process names used to detect a running instance
+CHROMIUM_BROWSERS = {
+    'Google Chrome': {
+        'Windows': (("AppData", "Local", "Google", "Chrome", "User Data"), None),
+        'Darwin': (("Library", "Application Support", "Google", "Chrome"), ("Library", "Caches", "Google", "Chrome")),
+        'Linux': ((".config", "google-chrome"), (".cache", "google-chrome")),
+        'processes': ['chrome.exe', 'google-chrome', 'Google Chrome']
+    },
+    'Chromium': {
+        'Windows': (("AppData", "Local", "Chromium", "User Data"), None),
+        'Darwin': (("Library", "Application Support", "Chromium"), ("Library", "Caches", "Chromium")),
+        'Linux': ((".config", "chromium"), (".cache", "chromium")),
+        'processes': ['chromium']
+    },
+    'Microsoft Edge': {
+        'Windows': (("AppData", "Local", "Microsoft", "Edge", "User Data"), None),
+        'Darwin': (("Library", "Application Support", "Microsoft Edge"), ("Library", "Caches", "Microsoft Edge")),
+        'Linux': ((".config", "microsoft-edge"), (".cache", "microsoft-edge")),
+        'processes': ['msedge', 'Microsoft Edge']
+    },
+    'Brave': {
+        'Windows': (("AppData", "Local", "BraveSoftware", "Brave-Browser", "User Data"), None),
+        'Darwin': (("Library", "Application Support", "BraveSoftware", "Brave-Browser"),
+                   ("Library", "Caches", "BraveSoftware", "Brave-Browser")),
+        'Linux': ((".config", "BraveSoftware", "Brave-Browser"), (".cache", "BraveSoftware", "Brave-Browser")),
+        'processes': ['brave']
+    },
+    'Vivaldi': {
+        'Windows': (("AppData", "Local", "Vivaldi", "User Data"), None),
+        'Darwin': (("Library", "Application Support", "Vivaldi"), ("Library", "Caches", "Vivaldi")),
+        'Linux': ((".config", "vivaldi"), (".cache", "vivaldi")),
+        'processes': ['vivaldi']
+    }
+}
 
 class ChromeDataLocator:
-    """Locates Chrome data directories across different operating systems"""
+    """Locates Chromium-family browser data directories across operating systems"""
+    
+    PROFILE_CACHE_DIRS = ["Cache", "Code Cache"]
+    
+    # user data dir -> (Local State mtime, profile records)
+    _profile_cache: Dict[str, Tuple[int, List[Dict]]] = {}
+    _cache_lock = threading.Lock()
     
     @staticmethod
-    def get_chrome_profiles() -> List[Path]:
-        """Get all Chrome profile directories"""
+    def get_browser_dirs() -> List[Tuple[str, Path, Optional[Path]]]:
+        """Return (browser, user data dir, cache root) for every known browser on this platform"""
+        system = platform.system()
+        if system not in ("Windows", "Darwin"):
+            system = "Linux"
+        
+        home = Path.home()
+        dirs = []
+        for browser, table in CHROMIUM_BROWSERS.items():
+            user_data, cache_root = table[system]
+            dirs.append((
+                browser,
+                home.joinpath(*user_data),
+                home.joinpath(*cache_root) if cache_root else None
+            ))
+        return dirs
+    
+    @staticmethod
+    def _read_local_state(user_data_dir: Path) -> Optional[Dict]:
+        """Return profile.info_cache from a browser's Local State file"""
+        local_state_path = user_data_dir / "Local State"
+        if not local_state_path.exists():
+            return None
+        
+        try:
+            with open(local_state_path, 'r', encoding='utf-8') as f:
+                local_state = json.load(f)
+            info_cache = local_state.get('profile', {}).get('info_cache')
+            return info_cache if isinstance(info_cache, dict) else None
+        except (OSError, ValueError, AttributeError) as e:
+            logging.warning(f"Could not read Local State in {user_data_dir}: {e}")
+            return None
+    
+    @staticmethod
+    def _is_profile_dir_name(name) -> bool:
+        """Local State keys must be a single plain path component inside the user data dir"""
+        return (
+            isinstance(name, str) and name not in ("", ".")
+            and ".." not in name
+            and not any(sep in name for sep in ("/", "\\", "\0"))
+            and not Path(name).is_absolute()
+            and PureWindowsPath(name).name == name
+        )
+    
+    @staticmethod
+    def _discover_profiles(browser: str, user_data_dir: Path, cache_root: Optional[Path]) -> List[Dict]:
+        """Build profile records for one browser installation"""
+        info_cache = ChromeDataLocator._read_local_state(user_data_dir)
+        
+        if info_cache is not None:
+            entries = []
+            for name, info in info_cache.items():
+                if not ChromeDataLocator._is_profile_dir_name(name):
+                    logging.warning(f"Ignoring invalid profile directory {name!r} in {user_data_dir / 'Local State'}")
+                    continue
+                entries.append((name, info.get('name', name) if isinstance(info, dict) else name))
+        else:
+            # No usable Local State: fall back to the conventional directory names
+            entries = [(item.name, item.name) for item in user_data_dir.iterdir()
+                       if item.is_dir() and (item.name == "Default" or item.name.startswith("Profile "))]
+        
+        profiles = []
+        for dir_name, display_name in sorted(entries):
+            profile_path = user_data_dir / dir_name
+            cache_dirs = [profile_path / name for name in ChromeDataLocator.PROFILE_CACHE_DIRS]
+            if cache_root is not None:
+                cache_dirs.extend(cache_root / dir_name / name for name in ChromeDataLocator.PROFILE_CACHE_DIRS)
+            
+            profiles.append({
+                'browser': browser,
+                'name': display_name,
+                'path': profile_path,
+                'cache_dirs': cache_dirs
+            })
+        return profiles
+    
+    @staticmethod
+    def get_browser_profiles() -> List[Dict]:
+        """
+        Get profile records for all installed Chromium-family browsers.
+        Each record has browser, display name, profile path and the
+        profile's cache directories. Results are cached per browser and
+        re-read only when its Local State file changes.
+        """
         profiles = []
         
-        if platform.system() == "Windows":
-            base_paths = [
-                Path.home() / "AppData" / "Local" / "Google" / "Chrome" / "User Data",
-                Path.home() / "AppData" / "Local" / "Chromium" / "User Data"
-            ]
-        elif platform.system() == "Darwin":  # macOS
-            base_paths = [
-                Path.home() / "Library" / "Application Support" / "Google" / "Chrome",
-                Path.home() / "Library" / "Application Support" / "Chromium"
-            ]
-        else:  # Linux
-            base_paths = [
-                Path.home() / ".config" / "google-chrome",
-                Path.home() / ".config" / "chromium"
-            ]
-        
-        for base_path in base_paths:
-            if base_path.exists():
-                # Default profile
-                if (base_path / "Default").exists():
-                    profiles.append(base_path / "Default")
-                
-                # Additional profiles
-                for item in base_path.iterdir():
-                    if item.is_dir() and item.name.startswith("Profile "):
-                        profiles.append(item)
+        for browser, user_data_dir, cache_root in ChromeDataLocator.get_browser_dirs():
+            if not user_data_dir.is_dir():
+                continue
+            
+            # Without a Local State the fallback listing is keyed on the directory itself
+            try:
+                mtime = os.stat(user_data_dir / "Local State").st_mtime_ns
+            except OSError:
+                mtime = -os.stat(user_data_dir).st_mtime_ns
+            
+            key = str(user_data_dir)
+            with ChromeDataLocator._cache_lock:
+                cached = ChromeDataLocator._profile_cache.get(key)
+            
+            if cached is not None and cached[0] == mtime:
+                records = cached[1]
+            else:
+                records = ChromeDataLocator._discover_profiles(browser, user_data_dir, cache_root)
+                with ChromeDataLocator._cache_lock:
+                    ChromeDataLocator._profile_cache[key] = (mtime, records)
+            
+            for record in records:
+                if record['path'].is_dir():
+                    profiles.append(dict(record, cache_dirs=[d for d in record['cache_dirs'] if d.is_dir()]))
         
         return profiles
     
+    @staticmethod
+    def get_chrome_profiles() -> List[Path]:
+        """Get all Chromium-family profile directories"""
+        return [record['path'] for record in ChromeDataLocator.get_browser_profiles()]
+    
     @staticmethod
     def get_chrome_cache_dirs() -> List[Path]:
-        """Get Chrome cache directories"""
+        """Get browser cache directories"""
         cache_dirs = []
         
-        if platform.system() == "Windows":
-            cache_paths = [
-                Path.home() / "AppData" / "Local" / "Google" / "Chrome" / "User Data" / "Default" / "Cache",
-                Path.home() / "AppData" / "Local" / "Google" / "Chrome" / "User Data" / "ShaderCache"
-            ]
-        elif platform.system() == "Darwin":
-            cache_paths = [
-                Path.home() / "Library" / "Caches" / "Google" / "Chrome",
-                Path.home() / "Library" / "Application Support" / "Google" / "Chrome" / "Default" / "Cache"
-            ]
-        else:
-            cache_paths = [
-                Path.home() / ".cache" / "google-chrome",
-                Path.home() / ".config" / "google-chrome" / "Default" / "Cache"
-            ]
+        for browser, user_data_dir, cache_root in ChromeDataLocator.get_browser_dirs():
+            if cache_root is not None and cache_root.is_dir():
+                cache_dirs.append(cache_root)
+            if (user_data_dir / "ShaderCache").is_dir():
+                cache_dirs.append(user_data_dir / "ShaderCache")
         
-        for cache_path in cache_paths:
-            if cache_path.exists():
-                cache_dirs.append(cache_path)
+        # Per-profile caches not already covered by a browser-level cache root
+        for record in ChromeDataLocator.get_browser_profiles():
+            for cache_dir in record['cache_dirs']:
+                if not any(cache_dir == root or root in cache_dir.parents for root in cache_dirs):
+                    cache_dirs.append(cache_dir)
         
         return cache_dirs
 
 class ProcessManager:
     """Manages Chrome process detection and termination"""
     
-    @staticmethod
-    def is_chrome_running() -> bool:
-        """Check if Chrome processes are running"""
-        chrome_processes = ['chrome.exe', 'chromium', 'google-chrome', 'Google Chrome']
-        
-        for proc in psutil.process_iter(['pid', 'name']):
+    @staticmethod
+    def get_process_names() -> List[str]:
+        """Process names of all supported Chromium-family browsers"""
+        return [name for table in CHROMIUM_BROWSERS.values() for name in table['processes']]
+    
+    @staticmethod
+    def is_chrome_running() -> bool:
+        """Check if Chrome processes are running"""
+        chrome_processes = ProcessManager.get_process_names()
+        
+        for proc in psutil.process_iter(['pid', 'name']):
+            try:
+                if any(chrome_name.lower() in proc.info['name'].lower() 
+                      for chrome_name in chrome_processes):
+                    return True
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        
+        return False
+    
+    @staticmethod
+    def terminate_chrome_processes() -> bool:
+        """Forcefully terminate all Chrome processes"""
+        chrome_processes = ProcessManager.get_process_names()
+        terminated = []
+        
+        for proc in psutil.process_iter(['pid', 'name']):
+            try:
+                if any(chrome_name.lower() in proc.info['name'].lower() 
+                      for chrome_name in chrome_processes):
+                    proc.terminate()
+                    terminated.append(proc.info['pid'])
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        
+        # Wait for processes to terminate
+        time.sleep(2)
+        
+        # Force kill if still running
+        for proc in psutil.process_iter(['pid', 'name']):
+            try:
+                if any(chrome_name.lower() in proc.info['name'].lower() 
+                      for chrome_name in chrome_processes):
+                    proc.kill()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        
+        return len(terminated) > 0
+
+# Per-profile artifact categories and the profile-relative files/directories they cover
+PROFILE_ARTIFACTS = {
+    'history': {
+        'label': "History",
+        'paths': ["History", "History-journal", "Visited Links", "Top Sites", "Top Sites-journal",
+                  "Shortcuts", "Shortcuts-journal", "Favicons", "Favicons-journal"]
+    },
+    'cookies': {
+        'label': "Cookies",
+        'paths': ["Cookies", "Cookies-journal", "Network/Cookies", "Network/Cookies-journal"]
+    },
+    'cache': {
+        'label': "Cache",
+        'paths': ["Cache"]
+    },
+    'code_cache': {
+        'label': "Code Cache",
+        'paths': ["Code Cache", "GPUCache"]
+    },
+    'local_storage': {
+        'label': "Local Storage",
+        'paths': ["Local Storage", "Session Storage", "Service Worker"]
+    },
+    'indexeddb': {
+        'label': "IndexedDB",
+        'paths': ["IndexedDB"]
+    },
+    'sessions': {
+        'label': "Sessions",
+        'paths': ["Sessions", "Current Session", "Current Tabs", "Last Session", "Last Tabs"]
+    },
+    'passwords': {
+        'label': "Passwords",
+        'paths': ["Login Data", "Login Data-journal", "Login Data For Account", "Login Data For Account-journal"]
+    },
+    'bookmarks': {
+        'label': "Bookmarks",
+        'paths': ["Bookmarks", "Bookmarks.bak"]
+    },
+    'extensions': {
+        'label': "Extensions",
+        'paths': ["Extensions", "Extension State", "Local Extension Settings"]
+    }
+}
+
+class DataAnalyzer:
+    """Analyzes Chrome data for deletion statistics"""
+    
+    @staticmethod
+    def find_artifacts(profile_path: Path, cache_dirs: Optional[List[Path]] = None) -> Dict[str, List[Path]]:
+        """
+        Find the artifact paths present in a profile, by category.
+        cache_dirs adds caches that live outside the profile directory.
+        """
+        artifacts = {}
+        
+        for category, artifact in PROFILE_ARTIFACTS.items():
+            paths = [profile_path / rel for rel in artifact['paths'] if (profile_path / rel).exists()]
+            if category in ('cache', 'code_cache') and cache_dirs:
+                names = {Path(rel).name for rel in artifact['paths']}
+                paths.extend(d for d in cache_dirs if d.name in names and d not in paths)
+            if paths:
+                artifacts[category] = paths
+        
+        return artifacts
+    
+    @staticmethod
+    def classify_path(rel_path: str) -> Optional[str]:
+        """Artifact category of a '/'-separated path inside a profile or cache root"""
+        parts = rel_path.split('/')
+        for category, artifact in PROFILE_ARTIFACTS.items():
+            for artifact_path in artifact['paths']:
+                artifact_parts = artifact_path.split('/')
+                width = len(artifact_parts)
+                for i in range(len(parts) - width + 1):
+                    if parts[i:i + width] == artifact_parts:
+                        return category
+        return None
+    
+    @staticmethod
+    def analyze_profile(profile_path: Path) -> Dict[str, int]:
+        """Analyze Chrome profile for data statistics"""
+        stats = {
+            'history_entries': 0,
+            'cookies': 0,
+            'downloads': 0,
+            'cache_files': 0,
+            'bookmarks': 0,
+            'passwords': 0,
+            'extensions': 0
+        }
+        
+        try:
+            # History database
+            history_db = profile_path / "History"
+            if history_db.exists():
+                conn = sqlite3.connect(str(history_db))
+                cursor = conn.cursor()
+                cursor.execute("SELECT COUNT(*) FROM urls")
+                stats['history_entries'] = cursor.fetchone()[0]
+                conn.close()
+            
+            # Cookies database
+            cookies_db = profile_path / "Cookies"
+            if cookies_db.exists():
+                conn = sqlite3.connect(str(cookies_db))
+                cursor = conn.cursor()
+                cursor.execute("SELECT COUNT(*) FROM cookies")
+                stats['cookies'] = cursor.fetchone()[0]
+                conn.close()
+            
+            # Downloads database
+            downloads_db = profile_path / "History"
+            if downloads_db.exists():
+                conn = sqlite3.connect(str(downloads_db))
+                cursor = conn.cursor()
+                cursor.execute("SELECT COUNT(*) FROM downloads")
+                stats['downloads'] = cursor.fetchone()[0]
+                conn.close()
+            
+            # Cache files
+            cache_dir = profile_path / "Cache"
+            if cache_dir.exists():
+                stats['cache_files'] = len(list(cache_dir.rglob("*")))
+            
+            # Bookmarks
+            bookmarks_file = profile_path / "Bookmarks"
+            if bookmarks_file.exists():
+                with open(bookmarks_file, 'r', encoding='utf-8') as f:
+                    bookmarks_data = json.load(f)
+                    stats['bookmarks'] = len(str(bookmarks_data).split('"url"')) - 1
+            
+            # Extensions
+            extensions_dir = profile_path / "Extensions"
+            if extensions_dir.exists():
+                stats['extensions'] = len([d for d in extensions_dir.iterdir() if d.is_dir()])
+            
+        except Exception as e:
+            logging.error(f"Error analyzing profile {profile_path}: {e}")
+        
+        return stats
+
+class WipePlanner:
+    """Builds the full file-level plan for a secure deletion run"""
+    
+    @staticmethod
+    def artifact_target(profile_path: Path, artifacts: Dict[str, List[Path]]) -> Dict:
+        """Describe a profile target limited to the given artifact categories"""
+        return {'path': Path(profile_path), 'artifacts': artifacts}
+    
+    @staticmethod
+    def _plan_target(target, passes: int, seen: Optional[set] = None) -> Dict:
+        """
+        Enumerate the files under a single target. Symlinks, sockets and
+        FIFOs are planned as empty entries so they are unlinked too and
+        their directories can be removed.
+        A target is either a path (wiped entirely) or an artifact target
+        from artifact_target() (only the listed artifact paths are wiped).
+        Files already in seen (planned by an overlapping target) are skipped.
+        """
+        if isinstance(target, dict):
+            path = Path(target['path'])
+            sources = [(category, Path(p)) for category, paths in target['artifacts'].items() for p in paths]
+        else:
+            path = Path(target)
+            sources = [(None, path)]
+        
+        entry = {
+            'path': path,
+            'categories': sorted({c for c, _ in sources if c is not None}),
+            'device': None,
+            'files': [],
+            'roots': [],
+            'file_count': 0,
+            'bytes': 0,
+            'write_bytes': 0
+        }
+        
+        try:
+            entry['device'] = os.stat(path).st_dev
+        except OSError:
+            return entry
+        
+        for category, source in sources:
+            if source.is_dir() and not source.is_symlink():
+                entry['roots'].append(str(source))
+                walker = WipePlanner._walk_files(str(source))
+            elif os.path.lexists(source):
+                parent = os.stat(source.parent)
+                walker = [(str(source), os.lstat(source), (parent.st_dev, parent.st_ino))]
+            else:
+                continue
+            
+            for filepath, st, parent_id in walker:
+                size = st.st_size if stat.S_ISREG(st.st_mode) else 0
+                if seen is not None:
+                    if filepath in seen:
+                        continue
+                    seen.add(filepath)
+                
+                entry['files'].append({
+                    'path': filepath,
+                    'size': size,
+                    'device': st.st_dev,
+                    'inode': st.st_ino,
+                    'dir': parent_id,
+                    'mtime_ns': st.st_mtime_ns,
+                    'category': category,
+                    'passes': passes
+                })
+                entry['file_count'] += 1
+                entry['bytes'] += size
+                entry['write_bytes'] += size * passes
+        
+        return entry
+    
+    @staticmethod
+    def _walk_files(directory: str):
+        """
+        Yield (path, lstat result, (st_dev, st_ino) of its directory) for
+        every non-directory under directory, including symlinks to
+        directories, which are listed but not followed. Uses os.fwalk so
+        each entry is stat'ed relative to its open directory instead of
+        resolving the full path again.
+        """
+        if SecureDeletion.DIR_FD_SUPPORTED:
+            for root, dirs, files, root_fd in os.fwalk(directory):
+                root_st = os.fstat(root_fd)
+                for name in files + dirs:
+                    try:
+                        st = os.stat(name, dir_fd=root_fd, follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if not stat.S_ISDIR(st.st_mode):
+                        yield os.path.join(root, name), st, (root_st.st_dev, root_st.st_ino)
+        else:
+            for root, dirs, files in os.walk(directory):
+                try:
+                    root_st = os.lstat(root)
+                except OSError:
+                    continue
+                for name in files + dirs:
+                    filepath = os.path.join(root, name)
+                    try:
+                        st = os.lstat(filepath)
+                    except OSError:
+                        continue
+                    if not stat.S_ISDIR(st.st_mode):
+                        yield filepath, st, (root_st.st_dev, root_st.st_ino)
+    
+    @staticmethod
+    def build_plan(targets: List, passes: int = 7, policy: Optional['PassPolicy'] = None) -> Dict:
+        """
+        Build a wipe plan for the given profile/cache directories or
+        artifact targets. Nothing is written or removed; the plan lists
+        every file, its size and the bytes each target will cost to
+        overwrite. A PassPolicy, if given, then sets per-file passes.
+        """
+        if passes < 1:
+            raise ValueError(f"Invalid pass count: {passes}")
+        
+        plan = {
+            'passes': passes,
+            'targets': [],
+            'file_count': 0,
+            'bytes': 0,
+            'write_bytes': 0
+        }
+        
+        seen = set()
+        for target in targets:
+            entry = WipePlanner._plan_target(target, passes, seen)
+            plan['targets'].append(entry)
+            plan['file_count'] += entry['file_count']
+            plan['bytes'] += entry['bytes']
+            plan['write_bytes'] += entry['write_bytes']
+        
+        if policy is not None:
+            policy.apply(plan)
+        
+        return plan
+
+class PassPolicy:
+    """
+    Rule-based choice of overwrite scheme and pass count per file.
+    Rules are checked in order and the first match wins; a rule matches
+    on any combination of 'glob' (against the path inside the profile or
+    cache root), 'category' (see PROFILE_ARTIFACTS) and 'min_size' /
+    'max_size' in bytes, and sets 'scheme' and/or 'passes'. Files matching
+    no rule keep the run's pass count and the default scheme.
+    
+    Config file (JSON):
+        {"rules": [{"category": "cache", "scheme": "random", "passes": 1},
+                   {"glob": "*Login Data*", "passes": 7}]}
+    """
+    
+    RULE_KEYS = {'glob', 'category', 'min_size', 'max_size', 'scheme', 'passes'}
+    
+    # Regenerable data gets one random pass; credentials keep full DoD passes
+    TIERED_RULES = [
+        {'category': 'passwords', 'scheme': 'dod5220', 'passes': 7},
+        {'category': 'cookies', 'scheme': 'dod5220', 'passes': 7},
+        {'category': 'cache', 'scheme': 'random', 'passes': 1},
+        {'category': 'code_cache', 'scheme': 'random', 'passes': 1},
+        {'category': 'extensions', 'scheme': 'random', 'passes': 1},
+        {'min_size': 256 * 1024 * 1024, 'scheme': 'random', 'passes': 1}
+    ]
+    
+    # The flash translation layer remaps overwrites to fresh pages, so extra
+    # passes mostly add wear; one random pass plus a TRIM (FilesystemTrim)
+    SOLID_STATE_RULES = [
+        {'scheme': 'random', 'passes': 1}
+    ]
+    
+    def __init__(self, rules: List[Dict], default_scheme: str = SecureDeletion.DEFAULT_SCHEME):
+        if default_scheme not in SecureDeletion.SCHEMES:
+            raise ValueError(f"Unknown wipe scheme: {default_scheme}")
+        for rule in rules:
+            if not isinstance(rule, dict):
+                raise ValueError(f"Pass policy rules must be objects, got: {rule!r}")
+            unknown = set(rule) - self.RULE_KEYS
+            if unknown:
+                raise ValueError(f"Unknown pass policy keys: {', '.join(sorted(unknown))}")
+            if rule.get('scheme', default_scheme) not in SecureDeletion.SCHEMES:
+                raise ValueError(f"Unknown wipe scheme: {rule['scheme']}")
+            if 'passes' in rule and (not PassPolicy._is_int(rule['passes']) or rule['passes'] < 1):
+                raise ValueError(f"Invalid pass count: {rule['passes']}")
+            if 'glob' in rule and not isinstance(rule['glob'], str):
+                raise ValueError(f"Invalid glob pattern: {rule['glob']!r}")
+            for key in ('min_size', 'max_size'):
+                if key in rule and (not PassPolicy._is_int(rule[key]) or rule[key] < 0):
+                    raise ValueError(f"Invalid {key}: {rule[key]!r}")
+            if 'category' in rule and rule['category'] not in PROFILE_ARTIFACTS:
+                raise ValueError(f"Unknown artifact category: {rule['category']}")
+        
+        self.rules = rules
+        self.default_scheme = default_scheme
+    
+    @staticmethod
+    def _is_int(value) -> bool:
+        """True for ints; JSON true/false load as bools, which are ints too"""
+        return isinstance(value, int) and not isinstance(value, bool)
+    
+    @staticmethod
+    def tiered() -> 'PassPolicy':
+        """Built-in policy: light passes for caches, full passes for credentials"""
+        return PassPolicy([dict(rule) for rule in PassPolicy.TIERED_RULES])
+    
+    @staticmethod
+    def solid_state() -> 'PassPolicy':
+        """Built-in policy recommended for SSD/NVMe targets, paired with a TRIM"""
+        return PassPolicy([dict(rule) for rule in PassPolicy.SOLID_STATE_RULES])
+    
+    @staticmethod
+    def load(path: Path) -> 'PassPolicy':
+        """Load a policy from a JSON config file"""
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        if not isinstance(config, dict) or not isinstance(config.get('rules'), list):
+            raise ValueError(f"Pass policy {path} must be an object with a 'rules' list")
+        return PassPolicy(config['rules'], config.get('default_scheme', SecureDeletion.DEFAULT_SCHEME))
+    
+    def resolve(self, rel_path: str, category: Optional[str], size: int) -> Optional[Dict]:
+        """Return the first rule matching a file, or None"""
+        for rule in self.rules:
+            if 'glob' in rule and not (fnmatch.fnmatch(rel_path, rule['glob'])
+                                       or fnmatch.fnmatch(rel_path, "*/" + rule['glob'])):
+                continue
+            if 'category' in rule and rule['category'] != category:
+                continue
+            if 'min_size' in rule and size < rule['min_size']:
+                continue
+            if 'max_size' in rule and size > rule['max_size']:
+                continue
+            return rule
+        return None
+    
+    @staticmethod
+    def _format_size(size: int) -> str:
+        for unit, scale in (("GB", 1024 ** 3), ("MB", 1024 ** 2), ("KB", 1024)):
+            if size >= scale and size % scale == 0:
+                return f"{size // scale} {unit}"
+        return f"{size} bytes"
+    
+    def describe(self, passes: int) -> List[str]:
+        """One line per rule, plus the fallback, for showing a policy to the user"""
+        lines = []
+        for rule in self.rules:
+            conditions = []
+            if 'category' in rule:
+                conditions.append(PROFILE_ARTIFACTS[rule['category']]['label'])
+            if 'glob' in rule:
+                conditions.append(f"Files matching {rule['glob']}")
+            if 'min_size' in rule:
+                conditions.append(f"Files from {PassPolicy._format_size(rule['min_size'])}")
+            if 'max_size' in rule:
+                conditions.append(f"Files up to {PassPolicy._format_size(rule['max_size'])}")
+            rule_passes = rule.get('passes', passes)
+            lines.append(f"{', '.join(conditions) or 'All files'}: {rule_passes} "
+                         f"pass{'es' if rule_passes != 1 else ''} ({rule.get('scheme', self.default_scheme)})")
+            if not conditions:
+                return lines
+        lines.append(f"Everything else: {passes} pass{'es' if passes != 1 else ''} ({self.default_scheme})")
+        return lines
+    
+    def apply(self, plan: Dict) -> Dict:
+        """Set scheme and passes on every planned file and recompute the byte totals"""
+        plan['write_bytes'] = 0
+        
+        for entry in plan['targets']:
+            root = str(entry['path'])
+            entry['write_bytes'] = 0
+            
+            for file in entry['files']:
+                try:
+                    rel_path = os.path.relpath(file['path'], root)
+                except ValueError:
+                    rel_path = '..'
+                if rel_path.startswith('..'):
+                    rel_path = file['path']
+                rel_path = rel_path.replace(os.sep, '/')
+                
+                category = file['category'] or DataAnalyzer.classify_path(rel_path)
+                rule = self.resolve(rel_path, category, file['size'])
+                file['scheme'] = self.default_scheme
+                if rule is not None:
+                    file['scheme'] = rule.get('scheme', self.default_scheme)
+                    file['passes'] = rule.get('passes', file['passes'])
+                entry['write_bytes'] += file['size'] * file['passes']
+            
+            plan['write_bytes'] += entry['write_bytes']
+        
+        return plan
+
+class WipeEstimator:
+    """Predicts wipe duration from a plan using on-device calibration"""
+    
+    CALIBRATION_BYTES = 16 * 1024 * 1024
+    CALIBRATION_SMALL_FILES = 32
+    
+    _calibration_cache: Dict[int, Dict[str, float]] = {}
+    _cache_lock = threading.Lock()
+    
+    @staticmethod
+    def calibrate(directory: Path) -> Dict[str, float]:
+        """
+        Measure write throughput of the device backing a directory.
+        Writes a short sequential temp file and a burst of small fsync'd
+        files next to the target, then removes them. Results are cached
+        per device for the lifetime of the process.
+        """
+        directory = Path(directory)
+        while not directory.is_dir() and directory != directory.parent:
+            directory = directory.parent
+        
+        device = os.stat(directory).st_dev
+        with WipeEstimator._cache_lock:
+            if device in WipeEstimator._calibration_cache:
+                return WipeEstimator._calibration_cache[device]
+        
+        chunk = b'\x00' * DeviceTuner.tune(device)['chunk_size']
+        
+        # Sequential throughput, using the same write size as the wipe engine
+        fd, temp_path = tempfile.mkstemp(prefix=".chromenuke-cal-", dir=str(directory))
+        try:
+            start = time.perf_counter()
+            with os.fdopen(fd, "wb") as file:
+                written = 0
+                while written < WipeEstimator.CALIBRATION_BYTES:
+                    file.write(chunk)
+                    written += len(chunk)
+                file.flush()
+                os.fsync(file.fileno())
+            seq_seconds = max(time.perf_counter() - start, 1e-6)
+        finally:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+        
+        # Per-file overhead: create, write one block, fsync, unlink
+        start = time.perf_counter()
+        for _ in range(WipeEstimator.CALIBRATION_SMALL_FILES):
+            fd, temp_path = tempfile.mkstemp(prefix=".chromenuke-cal-", dir=str(directory))
+            try:
+                os.write(fd, chunk[:4096])
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+                os.remove(temp_path)
+        small_seconds = (time.perf_counter() - start) / WipeEstimator.CALIBRATION_SMALL_FILES
+        
+        result = {
+            'seq_bytes_per_sec': WipeEstimator.CALIBRATION_BYTES / seq_seconds,
+            'small_file_seconds': small_seconds
+        }
+        logging.info(
+            f"Calibrated device {device}: {result['seq_bytes_per_sec'] / (1024 * 1024):.1f} MB/s sequential, "
+            f"{small_seconds * 1000:.2f} ms per small file"
+        )
+        
+        with WipeEstimator._cache_lock:
+            WipeEstimator._calibration_cache[device] = result
+        return result
+    
+    @staticmethod
+    def estimate_plan(plan: Dict, throttle: Optional[IOThrottle] = None) -> Dict:
+        """
+        Attach predicted wall time to every target of a plan.
+        Each pass costs the target's bytes at sequential speed plus one
+        small-file sync per file. With a throttle, a target takes at least
+        as long as its bytes and chunk writes need under the current limits.
+        """
+        total_seconds = 0.0
+        bytes_per_sec, iops = throttle.limits if throttle is not None else (None, None)
+        
+        for entry in plan['targets']:
+            if entry['device'] is None or entry['file_count'] == 0:
+                entry['calibration'] = None
+                entry['seconds'] = 0.0
+                continue
+            
+            try:
+                calibration = WipeEstimator.calibrate(entry['path'])
+            except OSError as e:
+                logging.warning(f"Could not calibrate {entry['path']}: {e}")
+                entry['calibration'] = None
+                entry['seconds'] = None
+                continue
+            
+            sync_count = sum(f['passes'] for f in entry['files'])
+            entry['calibration'] = calibration
+            entry['seconds'] = (
+                entry['write_bytes'] / calibration['seq_bytes_per_sec']
+                + sync_count * calibration['small_file_seconds']
+            )
+            if bytes_per_sec:
+                entry['seconds'] = max(entry['seconds'], entry['write_bytes'] / bytes_per_sec)
+            if iops:
+                # The throttle charges one operation per chunk written
+                chunk_size = DeviceTuner.tune(entry['device'])['chunk_size']
+                ops = sum(-(-f['size'] // chunk_size) * f['passes'] for f in entry['files'])
+                entry['seconds'] = max(entry['seconds'], ops / iops)
+            total_seconds += entry['seconds']
+        
+        plan['seconds'] = total_seconds
+        return plan
+    
+    @staticmethod
+    def estimate(targets: List, passes: int = 7, policy: Optional[PassPolicy] = None,
+                 throttle: Optional[IOThrottle] = None) -> Dict:
+        """Build a dry-run plan for targets and predict its wall time under throttle"""
+        return WipeEstimator.estimate_plan(WipePlanner.build_plan(targets, passes, policy), throttle)
+    
+    @staticmethod
+    def format_duration(seconds: Optional[float]) -> str:
+        """Render a duration estimate for display"""
+        if seconds is None:
+            return "unknown"
+        seconds = int(round(seconds))
+        hours, remainder = divmod(seconds, 3600)
+        minutes, secs = divmod(remainder, 60)
+        if hours:
+            return f"{hours}h {minutes:02d}m"
+        if minutes:
+            return f"{minutes}m {secs:02d}s"
+        return f"{secs}s"
+
+class FreeSpaceWiper:
+    """
+    Scrubs unallocated space on the filesystem holding a directory by filling
+    it with large fill files written in parallel, then deleting them. This
+    overwrites blocks left behind by earlier copies of browser data.
+    """
+    
+    FILL_PREFIX = ".chromenuke-fill-"
+    FILE_SIZE = 1024 * 1024 * 1024
+    WORKERS = 4
+    MIN_RESERVE = 256 * 1024 * 1024
+    RESERVE_FRACTION = 0.02
+    PROGRESS_INTERVAL = 0.5
+    
+    @staticmethod
+    def scrub_directory(path: Path) -> Path:
+        """Nearest existing directory to path (targets are usually gone after a wipe)"""
+        path = Path(path)
+        while not path.is_dir() and path != path.parent:
+            path = path.parent
+        return path
+    
+    @staticmethod
+    def find_mount_point(path: Path) -> Path:
+        """Mount point of the filesystem containing path"""
+        path = FreeSpaceWiper.scrub_directory(path).resolve()
+        while not os.path.ismount(path) and path != path.parent:
+            path = path.parent
+        return path
+    
+    @staticmethod
+    def cleanup_stale(directory: Path) -> None:
+        """Remove fill directories left by an interrupted earlier run"""
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.name.startswith(FreeSpaceWiper.FILL_PREFIX) and entry.is_dir(follow_symlinks=False):
+                logging.info(f"Removing stale free-space fill directory {entry.path}")
+                shutil.rmtree(entry.path, ignore_errors=True)
+    
+    @staticmethod
+    def wipe_free_space(directory: Path, reserve_bytes: Optional[int] = None,
+                        workers: Optional[int] = None, buffer_size: Optional[int] = None,
+                        cancel_event: Optional[threading.Event] = None,
+                        throttle: Optional[IOThrottle] = None,
+                        on_progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """
+        Fill the free space of directory's filesystem with random data, leaving
+        reserve_bytes free (default: the larger of MIN_RESERVE and
+        RESERVE_FRACTION of the filesystem). on_progress receives dicts with
+        bytes_done, bytes_target, bytes_per_sec and eta_seconds. Fill files are
+        always removed, including on cancellation, errors and interrupts.
+        """
+        directory = FreeSpaceWiper.scrub_directory(directory)
+        
+        # Same write size and stream count as file overwrites on this device;
+        # devices the tuner cannot identify keep WORKERS parallel fills
+        device = os.stat(directory).st_dev
+        tuning = DeviceTuner.tune(device)
+        if not workers:
+            known = hasattr(os, "major") and DeviceTuner.read_queue(device)['rotational'] is not None
+            workers = tuning['workers'] if known else FreeSpaceWiper.WORKERS
+        buffer_size = buffer_size or tuning['chunk_size']
+        
+        FreeSpaceWiper.cleanup_stale(directory)
+        
+        usage = shutil.disk_usage(directory)
+        if reserve_bytes is None:
+            reserve_bytes = max(FreeSpaceWiper.MIN_RESERVE, int(usage.total * FreeSpaceWiper.RESERVE_FRACTION))
+        target = max(0, usage.free - reserve_bytes)
+        
+        result = {
+            'directory': directory,
+            'bytes_target': target,
+            'bytes_written': 0,
+            'seconds': 0.0,
+            'cancelled': False
+        }
+        if target == 0:
+            logging.info(f"No free space to scrub on {directory} above the {reserve_bytes} byte reserve")
+            return result
+        
+        fill_dir = tempfile.mkdtemp(prefix=FreeSpaceWiper.FILL_PREFIX, dir=str(directory))
+        lock = threading.Lock()
+        stop = threading.Event()
+        state = {'allocated': 0, 'written': 0, 'files': 0, 'last_report': 0.0}
+        start = time.monotonic()
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        
+        def report(force=False):
+            now = time.monotonic()
+            if not force and now - state['last_report'] < FreeSpaceWiper.PROGRESS_INTERVAL:
+                return
+            state['last_report'] = now
+            elapsed = max(now - start, 1e-6)
+            rate = state['written'] / elapsed
+            if on_progress is not None:
+                on_progress({
+                    'directory': directory,
+                    'bytes_done': state['written'],
+                    'bytes_target': target,
+                    'bytes_per_sec': rate,
+                    'eta_seconds': (target - state['written']) / rate if rate else None
+                })
+        
+        def on_chunk(count):
+            with lock:
+                state['written'] += count
+                report()
+        
+        def fill_worker():
+            pattern = SecureDeletion.pass_pattern(0, buffer_size, "random")
+            while not stop.is_set():
+                with lock:
+                    size = min(FreeSpaceWiper.FILE_SIZE, target - state['allocated'])
+                    if size <= 0:
+                        return
+                    state['allocated'] += size
+                    index = state['files']
+                    state['files'] += 1
+                
+                path = os.path.join(fill_dir, f"fill-{index:06d}")
+                fd = os.open(path, flags, 0o600)
+                try:
+                    try:
+                        SecureDeletion.write_chunks(fd, pattern, size, cancel_event, throttle, path, on_chunk)
+                    except WipeCancelled:
+                        stop.set()
+                        return
+                    except OSError as e:
+                        if e.errno in (errno.ENOSPC, getattr(errno, "EDQUOT", errno.ENOSPC)):
+                            stop.set()
+                        elif e.errno != errno.EFBIG:
+                            raise
+                    
+                    os.fsync(fd)
+                    if hasattr(os, "posix_fadvise"):
+                        # Do not let the fill evict the page cache of co-located workloads
+                        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                finally:
+                    os.close(fd)
+        
+        logging.info(f"Scrubbing {target / (1024 * 1024):.0f} MB of free space on {directory} "
+                     f"with {workers} workers")
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(fill_worker) for _ in range(workers)]
+                try:
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    stop.set()
+                    raise
+        finally:
+            shutil.rmtree(fill_dir, ignore_errors=True)
+            result['bytes_written'] = state['written']
+            result['seconds'] = time.monotonic() - start
+            result['cancelled'] = cancel_event is not None and cancel_event.is_set()
+            with lock:
+                report(force=True)
+        
+        logging.info(f"Free-space scrub of {directory} finished: {state['written'] / (1024 * 1024):.0f} MB "
+                     f"in {result['seconds']:.1f}s")
+        return result
+
+class FilesystemTrim:
+    """
+    Finish stage for flash storage: asks each filesystem to discard its
+    unused blocks with the Linux FITRIM ioctl (what fstrim does), so blocks
+    freed by the wipe are released to the SSD now rather than at the next
+    garbage collection. Needs root (CAP_SYS_ADMIN) and a filesystem and
+    device that support discard.
+    """
+    
+    FITRIM = 0xC0185879  # _IOWR('X', 121, struct fstrim_range)
+    RANGE_FORMAT = "QQQ"  # struct fstrim_range: start, len, minlen
+    
+    @staticmethod
+    def supported() -> bool:
+        return fcntl is not None and sys.platform.startswith("linux")
+    
+    @staticmethod
+    def trim(mount_point: Path, min_extent: int = 0) -> int:
+        """
+        Discard all free extents of at least min_extent bytes on the
+        filesystem mounted at mount_point. Returns the number of bytes the
+        filesystem reports as trimmed; raises OSError when unsupported
+        (EOPNOTSUPP/ENOTTY) or not permitted (EPERM).
+        """
+        if not FilesystemTrim.supported():
+            raise OSError(errno.EOPNOTSUPP, "FITRIM is only available on Linux")
+        
+        fstrim_range = bytearray(struct.pack(FilesystemTrim.RANGE_FORMAT, 0, 2 ** 64 - 1, min_extent))
+        fd = os.open(str(mount_point), os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        try:
+            fcntl.ioctl(fd, FilesystemTrim.FITRIM, fstrim_range)
+        finally:
+            os.close(fd)
+        
+        trimmed = struct.unpack(FilesystemTrim.RANGE_FORMAT, fstrim_range)[1]
+        logging.info(f"Trimmed {trimmed / (1024 * 1024):.0f} MB on {mount_point}")
+        return trimmed
+
+class RunStatistics:
+    """
+    Incrementally maintained wipe counters. Memory use is constant however
+    many files are processed: only a bounded sample of errors is retained.
+    """
+    
+    MAX_ERRORS = 100
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.files_done = 0
+        self.files_wiped = 0
+        self.files_failed = 0
+        self.bytes_done = 0
+        self.bytes_wiped = 0
+        self.bytes_written = 0
+        self.seconds_total = 0.0
+        self.seconds_max = 0.0
+        self.pass_counts: Dict[int, int] = {}
+        self.error_count = 0
+        self.recent_errors = deque(maxlen=self.MAX_ERRORS)
+    
+    def record_file(self, size: int, passes: int, seconds: float, ok: bool):
+        with self._lock:
+            self.files_done += 1
+            self.bytes_done += size
+            self.seconds_total += seconds
+            self.seconds_max = max(self.seconds_max, seconds)
+            if ok:
+                self.files_wiped += 1
+                self.bytes_wiped += size
+                self.bytes_written += size * passes
+                self.pass_counts[passes] = self.pass_counts.get(passes, 0) + 1
+            else:
+                self.files_failed += 1
+    
+    def record_error(self, message: str):
+        with self._lock:
+            self.error_count += 1
+            self.recent_errors.append(message)
+    
+    def as_dict(self) -> Dict:
+        with self._lock:
+            return {
+                'files_done': self.files_done,
+                'files_wiped': self.files_wiped,
+                'files_failed': self.files_failed,
+                'bytes_wiped': self.bytes_wiped,
+                'bytes_written': self.bytes_written,
+                'seconds_mean': self.seconds_total / self.files_done if self.files_done else 0.0,
+                'seconds_max': self.seconds_max,
+                'pass_counts': dict(self.pass_counts),
+                'error_count': self.error_count
+            }
+
+class AuditManifest:
+    """
+    Streaming JSON-lines record of a wipe run. Each file becomes one compact
+    record (HMAC-SHA256 of the path, size, scheme, passes, duration, status),
+    buffered and appended in batches so memory stays flat. The first record
+    describes the run and the last one summarises it.
+    
+    Paths are keyed rather than plainly hashed: origin-named artifacts
+    (IndexedDB, Local Storage) would otherwise be recoverable by hashing a
+    list of domains. Without a key a random per-run key is used and never
+    stored, so the records only prove counts and outcomes; supply key to
+    be able to check a known path against the manifest later.
+    """
+    
+    BATCH_SIZE = 512
+    FLUSH_INTERVAL = 2.0
+    
+    def __init__(self, path: Path, batch_size: Optional[int] = None,
+                 flush_interval: Optional[float] = None, key: Optional[bytes] = None):
+        self._key = key if key else secrets.token_bytes(32)
+        self._key_supplied = bool(key)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size or self.BATCH_SIZE
+        self.flush_interval = flush_interval or self.FLUSH_INTERVAL
+        self._lock = threading.Lock()
+        self._pending: List[str] = []
+        self._last_flush = time.monotonic()
+        self._file = open(self.path, 'a', encoding='utf-8')
+    
+    @staticmethod
+    def default_path() -> Path:
+        """Timestamped manifest path next to the default log file"""
+        return DEFAULT_LOG_PATH.parent / "audit" / f"wipe-{datetime.now():%Y%m%d-%H%M%S}.jsonl"
+    
+    def path_hash(self, path: str) -> str:
+        return hmac.new(self._key, os.fsencode(path), hashlib.sha256).hexdigest()
+    
+    def _append(self, record: Dict, force_flush: bool = False):
+        line = json.dumps(record, separators=(',', ':'))
+        with self._lock:
+            self._pending.append(line)
+            if (force_flush or len(self._pending) >= self.batch_size
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self._flush_locked()
+    
+    def _flush_locked(self):
+        if self._pending:
+            self._file.write("\n".join(self._pending) + "\n")
+            self._pending.clear()
+        self._file.flush()
+        self._last_flush = time.monotonic()
+    
+    def write_run_header(self, plan: Dict):
+        self._append({
+            'type': 'run',
+            'started': datetime.now().isoformat(timespec='seconds'),
+            'host': platform.node(),
+            'passes': plan['passes'],
+            'files_planned': plan['file_count'],
+            'bytes_planned': plan['bytes'],
+            'path_key': 'supplied' if self._key_supplied else 'ephemeral'
+        }, force_flush=True)
+    
+    def record_file(self, file: Dict, ok: bool, seconds: float):
+        self._append({
+            'type': 'file',
+            'path_hmac': self.path_hash(file['path']),
+            'size': file['size'],
+            'scheme': file.get('scheme', SecureDeletion.DEFAULT_SCHEME),
+            'passes': file['passes'],
+            'ms': round(seconds * 1000, 3),
+            'status': 'wiped' if ok else 'failed'
+        })
+    
+    def write_summary(self, stats: RunStatistics, cancelled: bool):
+        record = {'type': 'summary', 'finished': datetime.now().isoformat(timespec='seconds'),
+                  'cancelled': cancelled}
+        record.update(stats.as_dict())
+        self._append(record, force_flush=True)
+    
+    def close(self):
+        with self._lock:
+            if self._file.closed:
+                return
+            self._flush_locked()
+            os.fsync(self._file.fileno())
+            self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+@dataclass
+class ProgressEvent:
+    """Progress of a running wipe, emitted after every file"""
+    path: str
+    ok: bool
+    files_done: int
+    files_total: int
+    bytes_done: int
+    bytes_total: int
+    
+    @property
+    def fraction(self) -> float:
+        if self.bytes_total:
+            return self.bytes_done / self.bytes_total
+        return self.files_done / self.files_total if self.files_total else 1.0
+
+@dataclass
+class TargetCompleteEvent:
+    """Result for one planned target"""
+    path: Path
+    categories: List[str]
+    files_wiped: int
+    bytes_wiped: int
+    failed: int
+
+@dataclass
+class ErrorEvent:
+    """A non-fatal error; path is None for errors not tied to a file"""
+    path: Optional[str]
+    message: str
+
+@dataclass
+class FreeSpaceProgressEvent:
+    """Progress of a free-space scrub on one filesystem"""
+    directory: Path
+    bytes_done: int
+    bytes_target: int
+    bytes_per_sec: float
+    eta_seconds: Optional[float]
+    
+    @property
+    def fraction(self) -> float:
+        return self.bytes_done / self.bytes_target if self.bytes_target else 1.0
+
+@dataclass
+class TrimEvent:
+    """Result of a TRIM on one filesystem"""
+    mount_point: Path
+    bytes_trimmed: int
+
+@dataclass
+class CompleteEvent:
+    """Final event of a wipe run"""
+    files_wiped: int
+    bytes_wiped: int
+    failed: int
+    cancelled: bool
+
+class WipeEngine:
+    """
+    UI-independent scan/analyze/plan/wipe orchestration.
+    The run_* methods are blocking; the coroutines run them in an executor
+    so many engines can be driven from one event loop. Use one engine per
+    job: cancel() stops that job's wipe at the next chunk.
+    
+    manifest, if given, is an AuditManifest that receives a record per file;
+    throttle is an IOThrottle whose limits may be changed mid-run;
+    io_priority is applied to the wipe worker thread (see IOPriority.apply)
+    and stays with that thread, so give low-priority jobs their own executor;
+    tuning overrides the per-device choices of DeviceTuner, e.g.
+    {'workers': 1} (None values keep the automatic choice).
+    """
+    
+    def __init__(self, executor=None, throttle: Optional[IOThrottle] = None,
+                 io_priority: Optional[Dict] = None, manifest: Optional['AuditManifest'] = None,
+                 tuning: Optional[Dict] = None):
+        self._executor = executor
+        self._cancel_event = threading.Event()
+        self.manifest = manifest
+        self.stats = RunStatistics()
+        self.throttle = throttle if throttle is not None else IOThrottle()
+        self.io_priority = io_priority
+        self.tuning = tuning
+    
+    def cancel(self):
+        """Request cooperative cancellation of the running wipe"""
+        self._cancel_event.set()
+    
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+    
+    def run_scan(self) -> Dict:
+        """Locate browser profiles and caches and check for running browsers"""
+        return {
+            'profiles': ChromeDataLocator.get_browser_profiles(),
+            'cache_dirs': ChromeDataLocator.get_chrome_cache_dirs(),
+            'browser_running': ProcessManager.is_chrome_running()
+        }
+    
+    def run_analyze(self, profile_path: Path, cache_dirs: Optional[List[Path]] = None) -> Dict:
+        """Collect statistics and artifact paths for one profile"""
+        return {
+            'stats': DataAnalyzer.analyze_profile(profile_path),
+            'artifacts': DataAnalyzer.find_artifacts(profile_path, cache_dirs)
+        }
+    
+    def run_plan(self, targets: List, passes: int = 7, policy: Optional[PassPolicy] = None) -> Dict:
+        """Build a wipe plan (see WipePlanner.build_plan)"""
+        return WipePlanner.build_plan(targets, passes, policy)
+    
+    def run_wipe(self, plan: Dict, emit: Callable[[object], None]) -> CompleteEvent:
+        """Execute a plan, reporting typed events through emit"""
+        self.stats = RunStatistics()
+        complete = CompleteEvent(files_wiped=0, bytes_wiped=0, failed=0, cancelled=False)
+        if self.manifest is not None:
+            self.manifest.write_run_header(plan)
+        
+        def on_file(file, ok, seconds):
+            self.stats.record_file(file['size'], file['passes'], seconds, ok)
+            if self.manifest is not None:
+                self.manifest.record_file(file, ok, seconds)
+            if not ok:
+                self.stats.record_error(f"Failed to wipe file: {file['path']}")
+                emit(ErrorEvent(path=file['path'], message="Failed to wipe file"))
+            emit(ProgressEvent(
+                path=file['path'],
+                ok=ok,
+                files_done=self.stats.files_done,
+                files_total=plan['file_count'],
+                bytes_done=self.stats.bytes_done,
+                bytes_total=plan['bytes']
+            ))
+        
+        IOPriority.apply(self.io_priority)
+        overrides = {k: v for k, v in (self.tuning or {}).items() if v is not None}
+        if overrides:
+            logging.info(f"Device tuning overridden: {overrides}")
+        
+        for entry in plan['targets']:
+            if self.cancelled:
+                complete.cancelled = True
+                break
+            
             try:
-                if any(chrome_name.lower() in proc.info['name'].lower() 
-                      for chrome_name in chrome_processes):
-                    return True
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                result = SecureDeletion.wipe_plan_entry(
+                    entry, self._cancel_event, on_file, self.throttle,
+                    DeviceTuner.tune(entry['device'], self.tuning)
+                )
+            except Exception as e:
+                logging.error(f"Error wiping {entry['path']}: {e}")
+                self.stats.record_error(f"Error wiping {entry['path']}: {e}")
+                emit(ErrorEvent(path=str(entry['path']), message=str(e)))
+                complete.failed += entry['file_count']
                 continue
-        
-        return False
+            
+            complete.files_wiped += result['files_wiped']
+            complete.bytes_wiped += result['bytes_wiped']
+            complete.failed += result['failed']
+            emit(TargetCompleteEvent(
+                path=entry['path'],
+                categories=entry['categories'],
+                files_wiped=result['files_wiped'],
+                bytes_wiped=result['bytes_wiped'],
+                failed=result['failed']
+            ))
+            
+            if result['cancelled']:
+                complete.cancelled = True
+                break
+        
+        if self.manifest is not None:
+            self.manifest.write_summary(self.stats, complete.cancelled)
+        emit(complete)
+        return complete
     
-    @staticmethod
-    def terminate_chrome_processes() -> bool:
-        """Forcefully terminate all Chrome processes"""
-        chrome_processes = ['chrome.exe', 'chromium', 'google-chrome', 'Google Chrome']
-        terminated = []
-        
-        for proc in psutil.process_iter(['pid', 'name']):
+    def run_free_space_wipe(self, paths: List[Path], emit: Callable[[object], None],
+                            reserve_bytes: Optional[int] = None) -> CompleteEvent:
+        """Scrub free space once per filesystem containing any of paths"""
+        complete = CompleteEvent(files_wiped=0, bytes_wiped=0, failed=0, cancelled=False)
+        
+        directories = {}
+        for path in paths:
+            directory = FreeSpaceWiper.scrub_directory(path)
+            directories.setdefault(os.stat(directory).st_dev, directory)
+        
+        IOPriority.apply(self.io_priority)
+        
+        for directory in directories.values():
+            if self.cancelled:
+                complete.cancelled = True
+                break
             try:
-                if any(chrome_name.lower() in proc.info['name'].lower() 
-                      for chrome_name in chrome_processes):
-                    proc.terminate()
-                    terminated.append(proc.info['pid'])
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                result = FreeSpaceWiper.wipe_free_space(
+                    directory,
+                    reserve_bytes=reserve_bytes,
+                    cancel_event=self._cancel_event,
+                    throttle=self.throttle,
+                    on_progress=lambda p: emit(FreeSpaceProgressEvent(**p))
+                )
+            except Exception as e:
+                logging.error(f"Error scrubbing free space on {directory}: {e}")
+                emit(ErrorEvent(path=str(directory), message=str(e)))
+                complete.failed += 1
                 continue
+            
+            complete.bytes_wiped += result['bytes_written']
+            complete.cancelled = result['cancelled']
         
-        # Wait for processes to terminate
-        time.sleep(2)
-        
-        # Force kill if still running
-        for proc in psutil.process_iter(['pid', 'name']):
+        emit(complete)
+        return complete
+    
+    def run_trim(self, paths: List[Path], emit: Callable[[object], None]) -> CompleteEvent:
+        """TRIM each filesystem containing any of paths (see FilesystemTrim)"""
+        complete = CompleteEvent(files_wiped=0, bytes_wiped=0, failed=0, cancelled=False)
+        
+        mount_points = {}
+        for path in paths:
+            mount_point = FreeSpaceWiper.find_mount_point(path)
+            mount_points.setdefault(os.stat(mount_point).st_dev, mount_point)
+        
+        for mount_point in mount_points.values():
+            if self.cancelled:
+                complete.cancelled = True
+                break
             try:
-                if any(chrome_name.lower() in proc.info['name'].lower() 
-                      for chrome_name in chrome_processes):
-                    proc.kill()
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                trimmed = FilesystemTrim.trim(mount_point)
+            except OSError as e:
+                logging.warning(f"Could not TRIM {mount_point}: {e}")
+                emit(ErrorEvent(path=str(mount_point), message=f"TRIM failed: {e}"))
+                complete.failed += 1
                 continue
+            complete.bytes_wiped += trimmed
+            emit(TrimEvent(mount_point=mount_point, bytes_trimmed=trimmed))
         
-        return len(terminated) > 0
-
-class DataAnalyzer:
-    """Analyzes Chrome data for deletion statistics"""
+        emit(complete)
+        return complete
     
-    @staticmethod
-    def analyze_profile(profile_path: Path) -> Dict[str, int]:
-        """Analyze Chrome profile for data statistics"""
-        stats = {
-            'history_entries': 0,
-            'cookies': 0,
-            'downloads': 0,
-            'cache_files': 0,
-            'bookmarks': 0,
-            'passwords': 0,
-            'extensions': 0
-        }
+    async def _run_in_executor(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+    
+    async def scan(self) -> Dict:
+        return await self._run_in_executor(self.run_scan)
+    
+    async def analyze(self, profile_path: Path, cache_dirs: Optional[List[Path]] = None) -> Dict:
+        return await self._run_in_executor(self.run_analyze, profile_path, cache_dirs)
+    
+    async def plan(self, targets: List, passes: int = 7, policy: Optional[PassPolicy] = None) -> Dict:
+        return await self._run_in_executor(self.run_plan, targets, passes, policy)
+    
+    async def wipe(self, plan: Dict) -> AsyncIterator[object]:
+        """
+        Execute a plan in the executor and yield its events as they occur.
+        The last event is a CompleteEvent. Leaving the iteration early
+        cancels the wipe.
+        """
+        async for event in self._stream(self.run_wipe, plan):
+            yield event
+    
+    async def scrub_free_space(self, paths: List[Path],
+                               reserve_bytes: Optional[int] = None) -> AsyncIterator[object]:
+        """Free-space scrub as an event stream, like wipe()"""
+        async for event in self._stream(self.run_free_space_wipe, paths, reserve_bytes=reserve_bytes):
+            yield event
+    
+    async def trim(self, paths: List[Path]) -> AsyncIterator[object]:
+        """TRIM as an event stream, like wipe()"""
+        async for event in self._stream(self.run_trim, paths):
+            yield event
+    
+    async def _stream(self, func, *args, **kwargs) -> AsyncIterator[object]:
+        """Run func(*args, emit, **kwargs) in the executor, yielding emitted events"""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = object()
         
-        try:
-            # History database
-            history_db = profile_path / "History"
-            if history_db.exists():
-                conn = sqlite3.connect(str(history_db))
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM urls")
-                stats['history_entries'] = cursor.fetchone()[0]
-                conn.close()
-            
-            # Cookies database
-            cookies_db = profile_path / "Cookies"
-            if cookies_db.exists():
-                conn = sqlite3.connect(str(cookies_db))
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM cookies")
-                stats['cookies'] = cursor.fetchone()[0]
-                conn.close()
-            
-            # Downloads database
-            downloads_db = profile_path / "History"
-            if downloads_db.exists():
-                conn = sqlite3.connect(str(downloads_db))
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM downloads")
-                stats['downloads'] = cursor.fetchone()[0]
-                conn.close()
-            
-            # Cache files
-            cache_dir = profile_path / "Cache"
-            if cache_dir.exists():
-                stats['cache_files'] = len(list(cache_dir.rglob("*")))
-            
-            # Bookmarks
-            bookmarks_file = profile_path / "Bookmarks"
-            if bookmarks_file.exists():
-                with open(bookmarks_file, 'r', encoding='utf-8') as f:
-                    bookmarks_data = json.load(f)
-                    stats['bookmarks'] = len(str(bookmarks_data).split('"url"')) - 1
-            
-            # Extensions
-            extensions_dir = profile_path / "Extensions"
-            if extensions_dir.exists():
-                stats['extensions'] = len([d for d in extensions_dir.iterdir() if d.is_dir()])
-            
-        except Exception as e:
-            logging.error(f"Error analyzing profile {profile_path}: {e}")
+        def emit(event):
+            loop.call_soon_threadsafe(queue.put_nowait, event)
         
-        return stats
+        def worker():
+            try:
+                func(*args, emit, **kwargs)
+            except Exception as e:
+                logging.error(f"Error during wipe: {e}")
+                emit(ErrorEvent(path=None, message=str(e)))
+            finally:
+                emit(finished)
+        
+        future = loop.run_in_executor(self._executor, worker)
+        try:
+            while True:
+                event = await queue.get()
+                if event is finished:
+                    break
+                yield event
+        finally:
+            if not future.done():
+                self.cancel()
+            await future
 
-class ChromeDataDestroyer(ctk.CTk):
+class ChromeDataDestroyer(ctk.CTk if ctk is not None else object):
     """Main application class with GUI"""
     
+    # I/O limit choices: label -> (bytes/sec, IOPS)
+    IO_LIMITS = {
+        "Unlimited": (None, None),
+        "200 MB/s": (200 * 1024 * 1024, None),
+        "50 MB/s": (50 * 1024 * 1024, 2000),
+        "10 MB/s": (10 * 1024 * 1024, 500),
+        "2 MB/s": (2 * 1024 * 1024, 100)
+    }
+    
     def __init__(self):
         super().__init__()
         
@@ -321,11 +2434,21 @@ class ChromeDataDestroyer(ctk.CTk):
         
         # Initialize variables
         self.profiles = []
+        self.profile_info = {}
+        self.profile_analysis = {}
+        self.profile_artifacts = {}
         self.cache_dirs = []
         self.selected_items = {}
         self.deletion_stats = {}
         self.is_scanning = False
         self.is_deleting = False
+        self.is_planning = False
+        self.engine = None
+        self.throttle = IOThrottle()
+        self.pass_policy = None
+        self._last_progress_update = 0.0
+        # _on_wipe_event is called from several wipe worker threads at once
+        self._stats_lock = threading.Lock()
         
         self.setup_ui()
         self.scan_chrome_data()
@@ -389,6 +2512,25 @@ class ChromeDataDestroyer(ctk.CTk):
         )
         self.btn_terminate.pack(side="left", padx=10, pady=10)
         
+        self.btn_dry_run = ctk.CTkButton(
+            self.controls_frame,
+            text="📋 Dry Run",
+            command=self.start_dry_run,
+            font=ctk.CTkFont(size=12, weight="bold"),
+            height=40
+        )
+        self.btn_dry_run.pack(side="left", padx=10, pady=10)
+        
+        self.btn_log = ctk.CTkButton(
+            self.controls_frame,
+            text="📜 Log",
+            command=lambda: LogViewerDialog(self),
+            font=ctk.CTkFont(size=12, weight="bold"),
+            height=40,
+            width=80
+        )
+        self.btn_log.pack(side="left", padx=10, pady=10)
+        
         self.btn_destroy = ctk.CTkButton(
             self.controls_frame,
             text="💀 SECURE DELETE",
@@ -431,6 +2573,74 @@ class ChromeDataDestroyer(ctk.CTk):
         # Update passes label
         self.passes_slider.configure(command=self.update_passes_label)
         
+        # Pass policy: uniform passes, built-in tiers, or a JSON config file
+        self.policy_var = ctk.StringVar(value="Uniform")
+        self.policy_menu = ctk.CTkOptionMenu(
+            self.settings_frame,
+            values=["Uniform", "Tiered", "SSD", "Load..."],
+            variable=self.policy_var,
+            command=self.update_pass_policy,
+            width=110
+        )
+        self.policy_menu.pack(side="left", padx=10, pady=10)
+        
+        self.scrub_free_space_var = ctk.BooleanVar(value=False)
+        self.scrub_free_space_checkbox = ctk.CTkCheckBox(
+            self.settings_frame,
+            text="Scrub free space",
+            variable=self.scrub_free_space_var,
+            font=ctk.CTkFont(size=12)
+        )
+        self.scrub_free_space_checkbox.pack(side="right", padx=10, pady=10)
+        
+        # Audit manifest is opt-in: even keyed, it records that a wipe took place
+        self.manifest_var = ctk.BooleanVar(value=False)
+        self.manifest_checkbox = ctk.CTkCheckBox(
+            self.settings_frame,
+            text="Audit manifest",
+            variable=self.manifest_var,
+            font=ctk.CTkFont(size=12)
+        )
+        self.manifest_checkbox.pack(side="right", padx=10, pady=10)
+        
+        # FITRIM finish stage for SSDs (Linux only)
+        self.trim_var = ctk.BooleanVar(value=False)
+        self.trim_checkbox = ctk.CTkCheckBox(
+            self.settings_frame,
+            text="TRIM (SSD)",
+            variable=self.trim_var,
+            font=ctk.CTkFont(size=12),
+            state="normal" if FilesystemTrim.supported() else "disabled"
+        )
+        self.trim_checkbox.pack(side="right", padx=10, pady=10)
+        
+        # I/O limits, applied live to a running wipe
+        self.low_priority_var = ctk.BooleanVar(value=False)
+        self.low_priority_checkbox = ctk.CTkCheckBox(
+            self.settings_frame,
+            text="Low I/O priority",
+            variable=self.low_priority_var,
+            font=ctk.CTkFont(size=12)
+        )
+        self.low_priority_checkbox.pack(side="right", padx=10, pady=10)
+        
+        self.io_limit_var = ctk.StringVar(value="Unlimited")
+        self.io_limit_menu = ctk.CTkOptionMenu(
+            self.settings_frame,
+            values=list(self.IO_LIMITS),
+            variable=self.io_limit_var,
+            command=self.update_io_limit,
+            width=110
+        )
+        self.io_limit_menu.pack(side="right", padx=10, pady=10)
+        
+        io_limit_label = ctk.CTkLabel(
+            self.settings_frame,
+            text="I/O limit:",
+            font=ctk.CTkFont(size=12, weight="bold")
+        )
+        io_limit_label.pack(side="right", padx=(10, 0), pady=10)
+        
         # Data selection frame
         self.data_frame = ctk.CTkScrollableFrame(self.main_frame)
         self.data_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
@@ -455,6 +2665,39 @@ class ChromeDataDestroyer(ctk.CTk):
         passes = int(value)
         self.passes_label.configure(text=f"{passes} passes")
     
+    def update_pass_policy(self, choice):
+        """Select the pass policy applied when planning"""
+        if choice == "Uniform":
+            self.pass_policy = None
+        elif choice == "Tiered":
+            self.pass_policy = PassPolicy.tiered()
+        elif choice == "SSD":
+            self.pass_policy = PassPolicy.solid_state()
+            if FilesystemTrim.supported():
+                self.trim_var.set(True)
+        else:
+            path = filedialog.askopenfilename(
+                title="Load pass policy",
+                filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            )
+            if not path:
+                self.policy_var.set("Uniform")
+                self.pass_policy = None
+                return
+            try:
+                self.pass_policy = PassPolicy.load(Path(path))
+                self.policy_var.set(Path(path).name)
+                logging.info(f"Loaded pass policy from {path}")
+            except (OSError, ValueError) as e:
+                logging.error(f"Could not load pass policy {path}: {e}")
+                messagebox.showerror("Pass Policy", f"Could not load pass policy:\n\n{e}")
+                self.policy_var.set("Uniform")
+                self.pass_policy = None
+    
+    def update_io_limit(self, choice):
+        """Apply the selected I/O limit, including to a wipe already running"""
+        self.throttle.set_limits(*self.IO_LIMITS[choice])
+    
     def scan_chrome_data(self):
         """Scan for Chrome data in a separate thread"""
         if self.is_scanning:
@@ -475,11 +2718,18 @@ class ChromeDataDestroyer(ctk.CTk):
             for widget in self.data_frame.winfo_children():
                 widget.destroy()
             
-            self.profiles = ChromeDataLocator.get_chrome_profiles()
-            self.cache_dirs = ChromeDataLocator.get_chrome_cache_dirs()
+            engine = WipeEngine()
+            scan = engine.run_scan()
+            self.profiles = [record['path'] for record in scan['profiles']]
+            self.profile_info = {record['path']: record for record in scan['profiles']}
+            self.profile_analysis = {
+                record['path']: engine.run_analyze(record['path'], record['cache_dirs'])
+                for record in scan['profiles']
+            }
+            self.cache_dirs = scan['cache_dirs']
             
             # Check if Chrome is running
-            chrome_running = ProcessManager.is_chrome_running()
+            chrome_running = scan['browser_running']
             
             # Update UI in main thread
             self.after(0, self._update_scan_results, chrome_running)
@@ -507,7 +2757,7 @@ class ChromeDataDestroyer(ctk.CTk):
             if self.profiles:
                 profiles_label = ctk.CTkLabel(
                     self.data_frame,
-                    text="Chrome Profiles Found:",
+                    text="Browser Profiles Found:",
                     font=ctk.CTkFont(size=16, weight="bold")
                 )
                 profiles_label.pack(anchor="w", padx=10, pady=(10, 5))
@@ -540,6 +2790,15 @@ class ChromeDataDestroyer(ctk.CTk):
             self.is_scanning = False
             self.btn_scan.configure(state="normal")
     
+    def _profile_title(self, profile_path):
+        """Checkbox label for a profile: browser and display name when known"""
+        record = self.profile_info.get(profile_path)
+        if record is None:
+            return f"Profile: {profile_path.name}"
+        if record['name'] != profile_path.name:
+            return f"{record['browser']}: {record['name']} ({profile_path.name})"
+        return f"{record['browser']}: {profile_path.name}"
+    
     def _create_profile_section(self, profile_path, index):
         """Create UI section for a Chrome profile"""
         profile_frame = ctk.CTkFrame(self.data_frame)
@@ -554,15 +2813,17 @@ class ChromeDataDestroyer(ctk.CTk):
         
         checkbox = ctk.CTkCheckBox(
             header_frame,
-            text=f"Profile: {profile_path.name}",
+            text=self._profile_title(profile_path),
             variable=checkbox_var,
             font=ctk.CTkFont(size=12, weight="bold")
         )
         checkbox.pack(side="left", padx=10)
         
+        analysis = self.profile_analysis.get(profile_path, {'stats': None, 'artifacts': {}})
+        
         # Analyze profile data
         try:
-            stats = DataAnalyzer.analyze_profile(profile_path)
+            stats = analysis['stats']
             
             stats_text = f"History: {stats['history_entries']} | Cookies: {stats['cookies']} | " \
                         f"Downloads: {stats['downloads']} | Cache: {stats['cache_files']} files"
@@ -578,6 +2839,28 @@ class ChromeDataDestroyer(ctk.CTk):
         except Exception as e:
             logging.error(f"Error analyzing profile {profile_path}: {e}")
         
+        # Per-artifact selection, used when the whole profile is not selected
+        artifacts = analysis['artifacts']
+        self.profile_artifacts[index] = artifacts
+        
+        if artifacts:
+            artifacts_frame = ctk.CTkFrame(profile_frame, fg_color="transparent")
+            artifacts_frame.pack(fill="x", padx=30, pady=(0, 5))
+            
+            for position, category in enumerate(artifacts):
+                artifact_var = ctk.BooleanVar()
+                self.selected_items[f"profile_{index}_{category}"] = artifact_var
+                
+                artifact_checkbox = ctk.CTkCheckBox(
+                    artifacts_frame,
+                    text=PROFILE_ARTIFACTS[category]['label'],
+                    variable=artifact_var,
+                    font=ctk.CTkFont(size=10),
+                    checkbox_width=16,
+                    checkbox_height=16
+                )
+                artifact_checkbox.grid(row=position // 5, column=position % 5, sticky="w", padx=5, pady=2)
+        
         # Path label
         path_label = ctk.CTkLabel(
             profile_frame,
@@ -658,13 +2941,103 @@ class ChromeDataDestroyer(ctk.CTk):
         else:
             messagebox.showinfo("Info", "Chrome is not currently running.")
     
+    def _get_selected_targets(self) -> List:
+        """
+        Return the selected targets: whole profiles and cache paths, or
+        artifact targets for profiles with only some categories selected
+        """
+        targets = []
+        for i, profile in enumerate(self.profiles):
+            if self.selected_items.get(f"profile_{i}", ctk.BooleanVar()).get():
+                targets.append(profile)
+                continue
+            
+            artifacts = {
+                category: paths
+                for category, paths in self.profile_artifacts.get(i, {}).items()
+                if self.selected_items.get(f"profile_{i}_{category}", ctk.BooleanVar()).get()
+            }
+            if artifacts:
+                targets.append(WipePlanner.artifact_target(profile, artifacts))
+        for i, cache_dir in enumerate(self.cache_dirs):
+            if self.selected_items.get(f"cache_{i}", ctk.BooleanVar()).get():
+                targets.append(cache_dir)
+        return targets
+    
+    def start_dry_run(self):
+        """Plan and estimate the selected deletion without touching any data"""
+        if self.is_planning or self.is_deleting:
+            return
+        
+        targets = self._get_selected_targets()
+        if not targets:
+            messagebox.showwarning("No Selection", "Please select items to plan.")
+            return
+        
+        self.is_planning = True
+        self.btn_dry_run.configure(state="disabled")
+        self.status_label.configure(text="Dry run: planning and calibrating disk throughput...")
+        
+        thread = threading.Thread(target=self._dry_run_thread, args=(targets, self.passes_var.get()))
+        thread.daemon = True
+        thread.start()
+    
+    def _dry_run_thread(self, targets, passes):
+        """Thread function for the dry-run estimate"""
+        try:
+            plan = WipeEstimator.estimate(targets, passes, self.pass_policy, self.throttle)
+            self.after(0, self._dry_run_complete, plan)
+        except Exception as e:
+            logging.error(f"Error during dry run: {e}")
+            self.after(0, self._dry_run_error, str(e))
+    
+    def _dry_run_complete(self, plan):
+        """Show the dry-run plan summary"""
+        lines = []
+        for entry in plan['targets']:
+            lines.append(
+                f"{entry['path'].name}: {entry['file_count']} files, "
+                f"{entry['bytes'] / (1024 * 1024):.1f} MB, "
+                f"~{WipeEstimator.format_duration(entry['seconds'])}"
+            )
+        
+        summary = (
+            f"Dry Run - no data was modified\n\n"
+            + "\n".join(lines) + "\n\n"
+            f"Total files: {plan['file_count']}\n"
+            f"Total data: {plan['bytes'] / (1024 * 1024):.1f} MB\n"
+            f"Overwrite passes: {plan['passes']}"
+            f"{' (adjusted per file by policy)' if self.pass_policy else ''}\n"
+            f"Total bytes to write: {plan['write_bytes'] / (1024 * 1024):.1f} MB\n"
+            f"Estimated time: {WipeEstimator.format_duration(plan['seconds'])}"
+        )
+        
+        if self.policy_var.get() != "SSD" and any(
+            DeviceTuner.is_solid_state(entry['device']) for entry in plan['targets']
+        ):
+            summary += ("\n\nSelected data is on an SSD: extra passes mostly land on fresh flash pages. "
+                        "The SSD policy (1 random pass) with TRIM finishes much faster.")
+        
+        self.status_label.configure(
+            text=f"Dry run complete - estimated {WipeEstimator.format_duration(plan['seconds'])}"
+        )
+        self.is_planning = False
+        self.btn_dry_run.configure(state="normal")
+        messagebox.showinfo("Dry Run", summary)
+    
+    def _dry_run_error(self, error_msg):
+        """Handle dry-run error"""
+        self.status_label.configure(text=f"Dry run error: {error_msg}")
+        self.is_planning = False
+        self.btn_dry_run.configure(state="normal")
+    
     def confirm_deletion(self):
         """Confirm deletion with user"""
         if self.is_deleting:
             return
         
         # Check if any items are selected
-        selected_count = sum(1 for var in self.selected_items.values() if var.get())
+        selected_count = len(self._get_selected_targets())
         
         if selected_count == 0:
             messagebox.showwarning("No Selection", "Please select items to delete.")
@@ -672,11 +3045,19 @@ class ChromeDataDestroyer(ctk.CTk):
         
         # Final confirmation
         passes = self.passes_var.get()
+        if self.pass_policy is None:
+            method = (f"This will permanently delete selected Chrome data using {passes} overwrite passes.\n\n"
+                      f"Selected items: {selected_count}\n"
+                      f"Deletion method: DoD 5220.22-M Standard\n\n")
+        else:
+            # Passes and scheme vary per file, so show the policy instead of a single count
+            rules = "\n".join(f"  • {line}" for line in self.pass_policy.describe(passes))
+            method = (f"This will permanently delete selected Chrome data.\n\n"
+                      f"Selected items: {selected_count}\n"
+                      f"Pass policy: {self.policy_var.get()}\n{rules}\n\n")
         result = messagebox.askyesno(
             "CONFIRM SECURE DELETION",
-            f"This will permanently delete selected Chrome data using {passes} overwrite passes.\n\n"
-            f"Selected items: {selected_count}\n"
-            f"Deletion method: DoD 5220.22-M Standard\n\n"
+            f"{method}"
             f"⚠️ THIS ACTION CANNOT BE UNDONE! ⚠️\n\n"
             f"Are you absolutely sure you want to proceed?",
             icon="warning"
@@ -698,63 +3079,46 @@ class ChromeDataDestroyer(ctk.CTk):
     def _deletion_thread(self):
         """Thread function for secure deletion"""
         try:
-            passes = self.passes_var.get()
-            total_items = sum(1 for var in self.selected_items.values() if var.get())
-            current_item = 0
+            io_priority = None
+            if self.low_priority_var.get():
+                io_priority = {'io_class': IOPriority.IOPRIO_CLASS_IDLE, 'nice': 10}
+            targets = self._get_selected_targets()
             
             self.deletion_stats = {
                 'profiles_deleted': 0,
                 'cache_dirs_deleted': 0,
                 'files_deleted': 0,
                 'bytes_deleted': 0,
-                'errors': []
+                'errors': deque(maxlen=RunStatistics.MAX_ERRORS),
+                'error_count': 0,
+                'cancelled': False,
+                'manifest': None,
+                'bytes_trimmed': 0,
+                'pass_counts': {}
             }
             
-            # Delete selected profiles
-            for i, profile in enumerate(self.profiles):
-                if self.selected_items.get(f"profile_{i}", ctk.BooleanVar()).get():
-                    current_item += 1
-                    progress = current_item / total_items
-                    
-                    self.after(0, self._update_progress, progress, f"Deleting profile: {profile.name}")
-                    
-                    try:
-                        # Calculate size before deletion
-                        size_before = sum(f.stat().st_size for f in profile.rglob('*') if f.is_file())
-                        
-                        if SecureDeletion.secure_directory_wipe(str(profile), passes):
-                            self.deletion_stats['profiles_deleted'] += 1
-                            self.deletion_stats['bytes_deleted'] += size_before
-                        else:
-                            self.deletion_stats['errors'].append(f"Failed to delete profile: {profile}")
-                            
-                    except Exception as e:
-                        error_msg = f"Error deleting profile {profile}: {e}"
-                        self.deletion_stats['errors'].append(error_msg)
-                        logging.error(error_msg)
-            
-            # Delete selected cache directories
-            for i, cache_dir in enumerate(self.cache_dirs):
-                if self.selected_items.get(f"cache_{i}", ctk.BooleanVar()).get():
-                    current_item += 1
-                    progress = current_item / total_items
-                    
-                    self.after(0, self._update_progress, progress, f"Deleting cache: {cache_dir.name}")
-                    
-                    try:
-                        # Calculate size before deletion
-                        size_before = sum(f.stat().st_size for f in cache_dir.rglob('*') if f.is_file())
-                        
-                        if SecureDeletion.secure_directory_wipe(str(cache_dir), passes):
-                            self.deletion_stats['cache_dirs_deleted'] += 1
-                            self.deletion_stats['bytes_deleted'] += size_before
-                        else:
-                            self.deletion_stats['errors'].append(f"Failed to delete cache: {cache_dir}")
-                            
-                    except Exception as e:
-                        error_msg = f"Error deleting cache {cache_dir}: {e}"
-                        self.deletion_stats['errors'].append(error_msg)
-                        logging.error(error_msg)
+            manifest = None
+            if self.manifest_var.get():
+                manifest = AuditManifest(AuditManifest.default_path())
+                self.deletion_stats['manifest'] = manifest.path
+            try:
+                self.engine = WipeEngine(throttle=self.throttle, io_priority=io_priority, manifest=manifest)
+                
+                self.after(0, self._update_progress, 0.0, "Planning secure deletion...")
+                plan = self.engine.run_plan(targets, self.passes_var.get(), self.pass_policy)
+                complete = self.engine.run_wipe(plan, self._on_wipe_event)
+                self.deletion_stats['pass_counts'] = self.engine.stats.as_dict()['pass_counts']
+            finally:
+                if manifest is not None:
+                    manifest.close()
+            
+            if self.scrub_free_space_var.get() and not complete.cancelled:
+                self.engine.run_free_space_wipe([entry['path'] for entry in plan['targets']],
+                                                self._on_wipe_event)
+            
+            if self.trim_var.get() and not complete.cancelled:
+                self.after(0, self._update_progress, 1.0, "Trimming free space...")
+                self.engine.run_trim([entry['path'] for entry in plan['targets']], self._on_wipe_event)
             
             # Completion
             self.after(0, self._deletion_complete)
@@ -763,12 +3127,62 @@ class ChromeDataDestroyer(ctk.CTk):
             logging.error(f"Error during deletion thread: {e}")
             self.after(0, self._deletion_error, str(e))
     
+    def _on_wipe_event(self, event):
+        """
+        Fold wipe engine events into stats and progress. Runs on the wipe
+        worker threads, several at once when the tuner picks parallel
+        workers, so stats are only touched under _stats_lock.
+        """
+        with self._stats_lock:
+            stats = self.deletion_stats
+            
+            if isinstance(event, ProgressEvent):
+                # Limit UI updates so large plans do not flood the Tk event queue
+                now = time.monotonic()
+                if now - self._last_progress_update >= 0.1 or event.files_done == event.files_total:
+                    self._last_progress_update = now
+                    self.after(0, self._update_progress, event.fraction,
+                               f"Wiping: {os.path.basename(event.path)}")
+            
+            elif isinstance(event, FreeSpaceProgressEvent):
+                self.after(0, self._update_progress, event.fraction,
+                           f"Scrubbing free space on {event.directory}: "
+                           f"{event.bytes_per_sec / (1024 * 1024):.0f} MB/s, "
+                           f"ETA {WipeEstimator.format_duration(event.eta_seconds)}")
+            
+            elif isinstance(event, TrimEvent):
+                stats['bytes_trimmed'] += event.bytes_trimmed
+            
+            elif isinstance(event, TargetCompleteEvent):
+                stats['files_deleted'] += event.files_wiped
+                stats['bytes_deleted'] += event.bytes_wiped
+                if event.failed == 0:
+                    is_profile = bool(event.categories) or event.path in self.profiles
+                    stats['profiles_deleted' if is_profile else 'cache_dirs_deleted'] += 1
+            
+            elif isinstance(event, ErrorEvent):
+                stats['error_count'] += 1
+                stats['errors'].append(f"{event.message}: {event.path}" if event.path else event.message)
+            
+            elif isinstance(event, CompleteEvent):
+                stats['cancelled'] = event.cancelled
+    
     def _update_progress(self, progress, message):
         """Update progress bar and message"""
         self.progress_bar.set(progress)
         self.progress_label.configure(text=message)
         self.status_label.configure(text=f"Secure deletion in progress... {int(progress * 100)}%")
     
+    @staticmethod
+    def _format_pass_counts(pass_counts: Dict[int, int]) -> str:
+        """'7' for a uniform run, '7 (12 files), 1 (340 files)' when a policy mixed them"""
+        if not pass_counts:
+            return "none"
+        if len(pass_counts) == 1:
+            return str(next(iter(pass_counts)))
+        return ", ".join(f"{passes} ({count} file{'s' if count != 1 else ''})"
+                         for passes, count in sorted(pass_counts.items(), reverse=True))
+    
     def _deletion_complete(self):
         """Handle deletion completion"""
         self.progress_bar.set(1.0)
@@ -783,15 +3197,21 @@ class ChromeDataDestroyer(ctk.CTk):
             f"Profiles deleted: {stats['profiles_deleted']}\n"
             f"Cache directories deleted: {stats['cache_dirs_deleted']}\n"
             f"Data securely wiped: {bytes_mb:.1f} MB\n"
-            f"Overwrite passes used: {self.passes_var.get()}\n\n"
+            f"Pass policy: {self.policy_var.get()}\n"
+            f"Overwrite passes used: {self._format_pass_counts(stats['pass_counts'])}\n\n"
         )
+        if stats['bytes_trimmed']:
+            completion_msg += f"Free space trimmed: {stats['bytes_trimmed'] / (1024 * 1024):.1f} MB\n\n"
         
-        if stats['errors']:
-            completion_msg += f"Errors encountered: {len(stats['errors'])}\n"
-            completion_msg += "Check log file for details."
+        if stats['error_count']:
+            completion_msg += f"Errors encountered: {stats['error_count']}\n"
+            completion_msg += f"Check the log (F2) or {LogPipeline.log_path} for details."
         else:
             completion_msg += "All selected data has been securely destroyed."
         
+        if stats['manifest']:
+            completion_msg += f"\n\nAudit manifest: {stats['manifest']}"
+        
         messagebox.showinfo("Deletion Complete", completion_msg)
         
         # Reset UI
@@ -825,11 +3245,13 @@ class ChromeDataDestroyer(ctk.CTk):
             )
             if not result:
                 return
+            if self.engine is not None:
+                self.engine.cancel()
         
         logging.info("Application closing")
         self.destroy()
 
-class AboutDialog(ctk.CTkToplevel):
+class AboutDialog(ctk.CTkToplevel if ctk is not None else object):
     """About dialog window"""
     
     def __init__(self, parent):
@@ -922,11 +3344,161 @@ complete and verifiable data destruction beyond standard deletion.
         )
         close_btn.pack(pady=10)
 
-def main():
+class LogViewerDialog(ctk.CTkToplevel if ctk is not None else object):
+    """Shows the most recent log lines from the in-memory ring buffer"""
+    
+    def __init__(self, parent):
+        super().__init__(parent)
+        
+        self.title("ChromeNuke Log")
+        self.geometry("800x500")
+        
+        self.transient(parent)
+        
+        self.setup_ui()
+        self.refresh()
+    
+    def setup_ui(self):
+        """Setup log viewer UI"""
+        main_frame = ctk.CTkFrame(self)
+        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        
+        path_label = ctk.CTkLabel(
+            main_frame,
+            text=f"Log file: {LogPipeline.log_path or 'not configured'}",
+            font=ctk.CTkFont(size=10),
+            text_color="#888888"
+        )
+        path_label.pack(anchor="w", padx=10, pady=(5, 5))
+        
+        self.log_text = ctk.CTkTextbox(main_frame, font=ctk.CTkFont(family="Courier", size=10))
+        self.log_text.pack(fill="both", expand=True, padx=10, pady=5)
+        
+        buttons_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        buttons_frame.pack(fill="x", padx=10, pady=(5, 0))
+        
+        refresh_btn = ctk.CTkButton(buttons_frame, text="Refresh", command=self.refresh, width=100)
+        refresh_btn.pack(side="left", padx=5)
+        
+        close_btn = ctk.CTkButton(buttons_frame, text="Close", command=self.destroy, width=100)
+        close_btn.pack(side="right", padx=5)
+    
+    def refresh(self):
+        """Reload lines from the ring buffer"""
+        self.log_text.configure(state="normal")
+        self.log_text.delete("1.0", "end")
+        self.log_text.insert("end", "\n".join(LogPipeline.recent_lines()))
+        self.log_text.see("end")
+        self.log_text.configure(state="disabled")
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="ChromeNuke - Military-Grade Data Destroyer")
+    parser.add_argument("--log-file", type=Path, default=None,
+                        help=f"Log file path (default: {DEFAULT_LOG_PATH})")
+    parser.add_argument("--log-level", default="INFO",
+                        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="Minimum level written to the log")
+    
+    incremental = parser.add_argument_group("scheduled incremental wipe (no GUI)")
+    incremental.add_argument("--incremental", action="store_true",
+                             help="Wipe the selected categories without the GUI, then exit")
+    incremental.add_argument("--categories", default="cache,code_cache",
+                             help="Comma-separated profile artifact categories to wipe "
+                                  f"({', '.join(PROFILE_ARTIFACTS)}); 'cache' includes browser cache roots")
+    incremental.add_argument("--passes", type=int, default=7, help="Overwrite passes (default: 7)")
+    incremental.add_argument("--policy", default=None,
+                             help="Pass policy: 'tiered', 'ssd' or a JSON file")
+    incremental.add_argument("--trim", action="store_true",
+                             help="TRIM each affected filesystem after the wipe (Linux, needs root)")
+    incremental.add_argument("--manifest-key-file", type=Path, default=None,
+                             help="Key for the audit manifest's path HMACs (default: random, not stored)")
+    incremental.add_argument("--workers", type=int, default=None,
+                             help="Parallel wipe workers per device (default: tuned per device)")
+    incremental.add_argument("--chunk-size", type=int, default=None, metavar="KB",
+                             help="Write size in KB (default: tuned per device)")
+    incremental.add_argument("--mmap", choices=["auto", "on", "off"], default="auto",
+                             help="Overwrite large files through mmap (default: auto, benchmarked per device)")
+    incremental.add_argument("--mmap-window", type=int, default=None, metavar="MB",
+                             help="Largest mmap window in MB, caps resident memory (default: 64)")
+    return parser.parse_args(argv)
+
+def run_incremental(args: argparse.Namespace) -> int:
+    """Headless incremental wipe for cron/Task Scheduler; returns the exit code"""
+    categories = [c.strip() for c in args.categories.split(',') if c.strip()]
+    unknown = [c for c in categories if c not in PROFILE_ARTIFACTS]
+    if unknown:
+        logging.error(f"Unknown categories: {', '.join(unknown)}")
+        return 2
+    if args.passes < 1:
+        logging.error("--passes must be at least 1")
+        return 2
+    if any(value is not None and value < 1 for value in (args.workers, args.chunk_size, args.mmap_window)):
+        logging.error("--workers, --chunk-size and --mmap-window must be positive")
+        return 2
+    
+    presets = {'tiered': PassPolicy.tiered, 'ssd': PassPolicy.solid_state}
+    try:
+        if args.policy in presets:
+            policy = presets[args.policy]()
+        else:
+            policy = PassPolicy.load(Path(args.policy)) if args.policy else None
+    except (OSError, ValueError) as e:
+        logging.error(f"Could not load pass policy {args.policy}: {e}")
+        return 2
+    
+    manifest_key = None
+    if args.manifest_key_file:
+        try:
+            manifest_key = args.manifest_key_file.read_bytes().strip()
+        except OSError as e:
+            logging.error(f"Could not read manifest key {args.manifest_key_file}: {e}")
+            return 2
+        if not manifest_key:
+            logging.error(f"Manifest key file {args.manifest_key_file} is empty")
+            return 2
+    
+    engine = WipeEngine(tuning={
+        'workers': args.workers,
+        'chunk_size': args.chunk_size * 1024 if args.chunk_size else None,
+        'mmap': {'on': True, 'off': False}.get(args.mmap),
+        'mmap_window': args.mmap_window * 1024 * 1024 if args.mmap_window else None
+    })
+    scan = engine.run_scan()
+    if scan['browser_running']:
+        logging.warning("Browser is running; skipping incremental wipe")
+        return 3
+    
+    targets = []
+    for record in scan['profiles']:
+        artifacts = DataAnalyzer.find_artifacts(record['path'], record['cache_dirs'])
+        selected = {c: paths for c, paths in artifacts.items() if c in categories}
+        if selected:
+            targets.append(WipePlanner.artifact_target(record['path'], selected))
+    if 'cache' in categories:
+        targets.extend(scan['cache_dirs'])
+    
+    plan = engine.run_plan(targets, args.passes, policy)
+    
+    with AuditManifest(AuditManifest.default_path(), key=manifest_key) as manifest:
+        engine.manifest = manifest
+        complete = engine.run_wipe(plan, lambda event: None)
+    
+    if args.trim and not complete.cancelled:
+        engine.run_trim([entry['path'] for entry in plan['targets']], lambda event: None)
+    
+    logging.info(f"Incremental wipe complete: {complete.files_wiped} files, "
+                 f"{complete.bytes_wiped / (1024 * 1024):.1f} MB, {complete.failed} failed; "
+                 f"manifest {manifest.path}")
+    return 0 if complete.failed == 0 else 1
+
+def main(argv: Optional[List[str]] = None):
     """Main application entry point"""
+    args = parse_args(argv)
+    
     try:
         # Check for required dependencies
-        required_modules = ['customtkinter', 'psutil']
+        required_modules = ['psutil'] if args.incremental else ['customtkinter', 'psutil']
         missing_modules = []
         
         for module in required_modules:
@@ -942,7 +3514,12 @@ def main():
             return 1
         
         # Initialize logging
+        log_path = LogPipeline.start(args.log_file, getattr(logging, args.log_level))
         logging.info("Starting Chrome Military-Grade Data Destroyer v2.1.0")
+        logging.info(f"Logging to {log_path}")
+        
+        if args.incremental:
+            return run_incremental(args)
         
         # Check CustomTkinter version compatibility
         try:
@@ -960,6 +3537,7 @@ def main():
         # Add keyboard shortcuts
         app.bind('<Control-q>', lambda e: app.on_closing())
         app.bind('<F1>', lambda e: AboutDialog(app))
+        app.bind('<F2>', lambda e: LogViewerDialog(app))
         app.bind('<F5>', lambda e: app.scan_chrome_data())
         
         logging.info("Application GUI initialized successfully")
@@ -981,6 +3559,10 @@ def main():
             print(f"Fatal error: {e}")
         
         return 1
+    
+    finally:
+        LogPipeline.stop()
 
 if __name__ == "__main__":
     exit_code = main()
+    sys.exit(exit_code)